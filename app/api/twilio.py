@@ -10,7 +10,7 @@ from fastapi.responses import PlainTextResponse, Response
 from app.audio import provider_supports_speed, rate_to_speed_factor
 from app.call_state import store_call
 from app.logging_utils import logger
-from app.memory import load_state
+from app.memory import aload_state
 from app.settings import get_agent_for_number
 from app.validators import validator as _twilio_validator
 
@@ -53,8 +53,7 @@ async def twiml(
         except Exception as exc:  # noqa: BLE001 – validation should remain best-effort
             logger.warning("Failed to parse POST body for signature validation: %s", exc)
 
-    merged_params = query_params.copy()
-    merged_params.update(body_params)
+    merged_params = {**query_params, **body_params}
 
     param_candidates: list[dict[str, str]] = []
     seen_param_fingerprints: set[tuple[tuple[str, str], ...]] = set()
@@ -104,7 +103,7 @@ async def twiml(
         saved_settings, saved_messages = (None, None)
         resumed = False
         if agent.get("continue_conversation"):
-            saved_settings, saved_messages = load_state(agent_name)
+            saved_settings, saved_messages = await aload_state(agent_name)
             if saved_messages is not None:
                 # Merge settings override
                 if saved_settings:
@@ -11,7 +11,6 @@ from typing import Any
 
 import litellm
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
-from fastapi.concurrency import run_in_threadpool
 
 from app.audio import (
     apply_prosody,
@@ -23,8 +22,8 @@ from app.audio import (
 from app.call_state import agent_is_active, mark_agent_active, pop_call, release_agent
 from app.chat import stream_response
 from app.logging_utils import logger
-from app.memory import delete_state, log_turn, save_state
-from app.metrics import METRIC_MESSAGES
+from app.memory import adelete_state, asave_state, queue_turn
+from app.metrics import METRIC_MESSAGES, METRICS_ENABLED
 from app.pricing import calculate_llm_cost, estimate_twilio_cost
 from app.settings import get_agent_config
 from app.validators import is_from_twilio
@@ -260,8 +259,9 @@ async def websocket_endpoint(ws: WebSocket):
 
             if msg.get("type") == "prompt":
                 user_text = msg.get("voicePrompt", "")
-                logger.info(f"🧑🧑🧑 User: '{user_text}'")
-                METRIC_MESSAGES.labels(role="user").inc()
+                logger.info("🧑🧑🧑 User: '%s'", user_text)
+                if METRICS_ENABLED:
+                    METRIC_MESSAGES.labels(role="user").inc()
 
                 # Fetch agent config resolved during setup
                 agent_cfg = ws.scope.get("agent_config")
@@ -272,7 +272,7 @@ async def websocket_endpoint(ws: WebSocket):
                     agent_cfg = get_agent_config("unknown-caller")
 
                 # Persist user turn without blocking the event loop
-                await run_in_threadpool(log_turn, "user", user_text)
+                await queue_turn("user", user_text)
 
                 # Track prompt tokens using litellm
                 try:
@@ -501,7 +501,7 @@ async def websocket_endpoint(ws: WebSocket):
                                 try:
                                     agent_name_reset = ws.scope.get("agent_name")
                                     if agent_name_reset:
-                                        delete_state(agent_name_reset)
+                                        await adelete_state(agent_name_reset)
                                 except Exception as exc:
                                     logger.error(
                                         "Failed to delete persisted state for %s: %s",
@@ -527,9 +527,7 @@ async def websocket_endpoint(ws: WebSocket):
 
                                 # Log the reset in memory to mark the boundary
                                 # between the old and new conversation.
-                                await run_in_threadpool(
-                                    log_turn, "system", "--- CONVERSATION RESET ---"
-                                )
+                                await queue_turn("system", "--- CONVERSATION RESET ---")
 
                                 # Refresh runtime settings so subsequent turns
                                 # use the new agent profile.
@@ -567,7 +565,7 @@ async def websocket_endpoint(ws: WebSocket):
                                     logger.error("token_counter failed: %s", exc)
 
                                 # Log this greeting as the first message of the new conversation
-                                await run_in_threadpool(log_turn, "bot", reset_message)
+                                await queue_turn("bot", reset_message)
 
                                 logger.info(
                                     "Reset complete - new conversation started with greeting: %s",
@@ -805,18 +803,21 @@ async def websocket_endpoint(ws: WebSocket):
                     assistant_text = "".join(assistant_full)
 
                     if assistant_text:
-                        await run_in_threadpool(log_turn, "bot", assistant_text)
+                        await queue_turn("bot", assistant_text)
 
                     # Persist state if enabled
                     try:
                         agent_name_persist = ws.scope.get("agent_name")
                         agent_cfg_persist = ws.scope.get("agent_config", {})
                         if agent_name_persist and agent_cfg_persist.get("continue_conversation"):
-                            save_state(agent_name_persist, agent_cfg_persist, ws.scope["messages"])
+                            await asave_state(
+                                agent_name_persist, agent_cfg_persist, ws.scope["messages"]
+                            )
                     except Exception as exc:
                         logger.error("Failed to save state: %s", exc)
 
-                    METRIC_MESSAGES.labels(role="bot").inc()
+                    if METRICS_ENABLED:
+                        METRIC_MESSAGES.labels(role="bot").inc()
 
                     if hangup_marker is not None:
                         reason = hangup_marker.get("reason", "Hangup requested")
@@ -16,6 +16,18 @@ __all__ = [
 
 _PROSODY_ATTR_NAMES: set[str] = {"rate", "pitch", "volume"}
 
+# Lookup tables built once at import instead of on every call.
+_DEFAULT_RATE_VALUES: frozenset[str] = frozenset({"100%", "normal", "medium"})
+_DEFAULT_LEVEL_VALUES: frozenset[str] = frozenset({"0%", "0", "default", "medium", "normal"})
+_RATE_WORDS: dict[str, float] = {
+    "x-slow": 0.75,
+    "slow": 0.85,
+    "medium": 1.0,
+    "fast": 1.15,
+    "x-fast": 1.2,
+}
+_SSML_VOICE_TOKENS: tuple[str, ...] = ("standard", "wavenet", "neural2", "studio", "journey")
+
 
 def merge_prosody(
     defaults: dict[str, str | float], override: dict[str, str | float] | None
@@ -71,17 +83,15 @@ def _is_default_rate(val: str | float | int) -> bool:
         normalised = _normalise_rate(val)
     except Exception:  # pragma: no cover - defensive
         return False
-    return str(normalised).strip().lower() in {"100%", "normal", "medium"}
+    return str(normalised).strip().lower() in _DEFAULT_RATE_VALUES
 
 
 def _is_default_pitch(val: str | float | int) -> bool:
-    sval = str(val).strip().lower()
-    return sval in {"0%", "0", "default", "medium", "normal"}
+    return str(val).strip().lower() in _DEFAULT_LEVEL_VALUES
 
 
 def _is_default_volume(val: str | float | int) -> bool:
-    sval = str(val).strip().lower()
-    return sval in {"0%", "0", "default", "medium", "normal"}
+    return str(val).strip().lower() in _DEFAULT_LEVEL_VALUES
 
 
 def prosody_is_useful(prosody: dict[str, str | float] | None) -> bool:
@@ -133,16 +143,8 @@ def apply_prosody(text: str, prosody: dict[str, str | float] | None) -> str:
 def voice_supports_ssml(voice: str) -> bool:
     """Return ``True`` if *voice* is on the SSML greenlist."""
 
-    green_tokens: tuple[str, ...] = (
-        "Standard",
-        "WaveNet",
-        "Wavenet",
-        "Neural2",
-        "Studio",
-        "Journey",
-    )
     name_lower = voice.lower()
-    return any(token.lower() in name_lower for token in green_tokens)
+    return any(token in name_lower for token in _SSML_VOICE_TOKENS)
 
 
 def provider_supports_speed(provider: str) -> bool:
@@ -160,15 +162,8 @@ def rate_to_speed_factor(rate_val: str | float | int) -> float:
             pct = float(val.rstrip("%")) / 100.0
             _validate_speed(pct)
             return pct
-        mapping = {
-            "x-slow": 0.75,
-            "slow": 0.85,
-            "medium": 1.0,
-            "fast": 1.15,
-            "x-fast": 1.2,
-        }
-        if val in mapping:
-            mapped = mapping[val]
+        mapped = _RATE_WORDS.get(val)
+        if mapped is not None:
             _validate_speed(mapped)
             return mapped
         numeric = float(val)
@@ -2,24 +2,70 @@
 
 from __future__ import annotations
 
+import heapq
+import time
+from dataclasses import dataclass
+
 CallSession = tuple[str, dict, list | None, bool, str | None]
 
 
-class _CallRegistry:
-    """In-memory registry for active ConversationRelay sessions."""
+@dataclass(slots=True, frozen=True)
+class _StagedCall:
+    """A staged call session and the monotonic time it expires, if ever."""
+
+    session: CallSession
+    expires_at: float | None
 
-    def __init__(self) -> None:
-        self._call_agent_map: dict[str, CallSession] = {}
+
+class _CallRegistry:
+    """In-memory registry for active ConversationRelay sessions.
+
+    Staged sessions are kept until their websocket connects. Passing
+    *staged_ttl_sec* opts into expiry: sessions staged longer ago than that are
+    dropped, so a late websocket falls back to the unknown-caller path.
+    """
+
+    def __init__(self, staged_ttl_sec: float | None = None) -> None:
+        self._staged_ttl_sec = staged_ttl_sec
+        self._call_agent_map: dict[str, _StagedCall] = {}
+        # Min-heap of (deadline, call_sid), only used when expiry is enabled;
+        # entries superseded by a later store() for the same call are skipped
+        # when they surface.
+        self._expiry_heap: list[tuple[float, str]] = []
         self._active_agents: set[str] = set()
 
     # ------------------------------------------------------------------
     # Call metadata staging (Twilio webhook → WebSocket setup handshake)
     # ------------------------------------------------------------------
     def store(self, call_sid: str, session: CallSession) -> None:
-        self._call_agent_map[call_sid] = session
+        if self._staged_ttl_sec is None:
+            self._call_agent_map[call_sid] = _StagedCall(session, None)
+            return
+        now = time.monotonic()
+        self._prune_expired(now)
+        deadline = now + self._staged_ttl_sec
+        self._call_agent_map[call_sid] = _StagedCall(session, deadline)
+        heapq.heappush(self._expiry_heap, (deadline, call_sid))
 
     def pop(self, call_sid: str) -> CallSession | None:
-        return self._call_agent_map.pop(call_sid, None)
+        # Lookups only check their own entry; pruning the rest is left to
+        # store() so the websocket handshake path stays a single dict pop.
+        entry = self._call_agent_map.pop(call_sid, None)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            return None
+        return entry.session
+
+    def _prune_expired(self, now: float) -> None:
+        """Drop staged sessions whose deadline has passed (O(k log n))."""
+
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            deadline, call_sid = heapq.heappop(heap)
+            entry = self._call_agent_map.get(call_sid)
+            if entry is not None and entry.expires_at == deadline:
+                del self._call_agent_map[call_sid]
 
     # ------------------------------------------------------------------
     # Concurrency guard helpers
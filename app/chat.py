@@ -1,6 +1,5 @@
 import asyncio  # Needed for async tool execution with thinking sounds
 import contextlib
-import copy
 import inspect
 import json
 import os
@@ -27,6 +26,7 @@ def acompletion(*args, **kwargs):
 
     return litellm.acompletion(*args, **kwargs)
 
+
 # URLs for sound effects (absolute URLs provided via env vars when deployed)
 _THINKING_SOUND_URL = os.getenv("SOUND_THINKING_URL", "/sounds/thinking.mp3")
 _FINISHED_SOUND_URL = os.getenv("SOUND_FINISHED_URL", "/sounds/finished.mp3")
@@ -280,22 +280,22 @@ async def stream_response(
 
             # Vertex/Gemini models reject certain JSON-Schema keywords like
             # "exclusiveMinimum".  Strip them out when target model is Gemini.
+            # Schemas are shared with the tool registry, so build cleaned copies.
             if any(k in agent["model"].lower() for k in ("gemini", "vertex")):
 
-                def _clean(d: dict):
+                def _clean(d: Any) -> Any:
                     if isinstance(d, dict):
-                        # Remove problematic numeric-bound keywords
-                        for bad in ("exclusiveMinimum", "exclusiveMaximum"):
-                            d.pop(bad, None)
-                        # Recurse
-                        for v in d.values():
-                            _clean(v)
-                    elif isinstance(d, list):
-                        for item in d:
-                            _clean(item)
-
-                for schema in tools:
-                    _clean(schema)
+                        # Drop problematic numeric-bound keywords and recurse
+                        return {
+                            k: _clean(v)
+                            for k, v in d.items()
+                            if k not in ("exclusiveMinimum", "exclusiveMaximum")
+                        }
+                    if isinstance(d, list):
+                        return [_clean(item) for item in d]
+                    return d
+
+                tools = [_clean(schema) for schema in tools]
         except Exception as exc:  # noqa: BLE001 – propagate config issues early
             logger.exception("Failed to build tool schemas: %s", exc)
             raise
@@ -381,24 +381,42 @@ async def stream_response(
 
     # Helper: truncate tool IDs for OpenAI's 40-character limit
     def _truncate_tool_ids_for_openai(msgs: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Return a deep copy of *msgs* with tool IDs clipped to the last 40
-        characters to satisfy OpenAI's 40-character limit. The original list is
-        left unmodified."""
-        clipped = copy.deepcopy(msgs)
-        for m in clipped:
-            # Truncate IDs inside assistant role tool_calls
-            for tc in m.get("tool_calls", []) or []:
-                if isinstance(tc, dict) and tc.get("id") and len(tc["id"]) > 40:
-                    original = tc["id"]
-                    tc["id"] = original[-40:]
-                    logger.debug("Truncated OpenAI tool id from %s… to …%s", original[:6], tc["id"])
-            # Truncate the tool_call_id field for tool role messages
-            if m.get("role") == "tool" and m.get("tool_call_id") and len(m["tool_call_id"]) > 40:
+        """Return *msgs* with tool IDs clipped to the last 40 characters to
+        satisfy OpenAI's 40-character limit. Only messages that need clipping
+        are copied; the rest are shared, and the original list is left
+        unmodified."""
+        clipped: list[dict[str, Any]] = []
+        for m in msgs:
+            tool_calls = m.get("tool_calls") or []
+            long_call_ids = any(
+                isinstance(tc, dict) and tc.get("id") and len(tc["id"]) > 40 for tc in tool_calls
+            )
+            long_tool_call_id = (
+                m.get("role") == "tool" and m.get("tool_call_id") and len(m["tool_call_id"]) > 40
+            )
+            if not (long_call_ids or long_tool_call_id):
+                clipped.append(m)
+                continue
+
+            m = dict(m)
+            if long_call_ids:
+                # Truncate IDs inside assistant role tool_calls
+                m["tool_calls"] = [dict(tc) if isinstance(tc, dict) else tc for tc in tool_calls]
+                for tc in m["tool_calls"]:
+                    if isinstance(tc, dict) and tc.get("id") and len(tc["id"]) > 40:
+                        original = tc["id"]
+                        tc["id"] = original[-40:]
+                        logger.debug(
+                            "Truncated OpenAI tool id from %s… to …%s", original[:6], tc["id"]
+                        )
+            if long_tool_call_id:
+                # Truncate the tool_call_id field for tool role messages
                 orig_id = m["tool_call_id"]
                 m["tool_call_id"] = orig_id[-40:]
                 logger.debug(
                     "Truncated OpenAI tool_call_id from %s… to …%s", orig_id[:6], m["tool_call_id"]
                 )
+            clipped.append(m)
         return clipped
 
     # Convenience: wrap litellm.acompletion so we always request streaming.
@@ -1148,7 +1166,7 @@ async def stream_response(
                                                 len(messages),
                                             )
                                     except Exception as e:
-                                        logger.error(f"Failed to update async message: {e}")
+                                        logger.error("Failed to update async message: %s", e)
 
                                 # Register the callback
                                 tf.register_async_callback(async_id, update_message)
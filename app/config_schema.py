@@ -83,40 +83,17 @@ class AgentConfig(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    @model_validator(mode="before")
-    def _validate_phone_numbers(
-        cls,
-        data: AgentConfig | dict[str, Any] | object,
-    ) -> AgentConfig | dict[str, Any] | object:
-        if isinstance(data, AgentConfig):
-            payload = data.model_dump()
-        elif isinstance(data, dict):
-            payload = data
-        elif hasattr(data, "data"):
-            payload = data.data or {}
-        else:
-            payload = {}
-
-        numbers = payload.get("phone_numbers") or []
+    @model_validator(mode="after")
+    def _validate_phone_numbers(self) -> AgentConfig:
+        numbers = self.phone_numbers or []
         if len(numbers) != len(set(numbers)):
             raise ValueError("Agent phone_numbers must be unique per agent")
-        return data
+        return self
 
     @model_validator(mode="before")
-    def _validate_tools(
-        cls,
-        data: AgentConfig | dict[str, Any] | object,
-    ) -> AgentConfig | dict[str, Any] | object:
-        if isinstance(data, AgentConfig):
-            payload = data.model_dump()
-        elif isinstance(data, dict):
-            payload = data
-        elif hasattr(data, "data"):
-            payload = data.data or {}
-        else:
-            payload = {}
-
-        tools = payload.get("tools")
+    @classmethod
+    def _validate_tools(cls, data: Any) -> Any:
+        tools = data.get("tools") if isinstance(data, dict) else None
         if tools is not None and not all(isinstance(t, str) for t in tools):
             raise TypeError("tools entries must be strings")
         return data
@@ -135,32 +112,24 @@ class ConfigModel(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    @model_validator(mode="before")
-    def _check_agents(cls, values: dict[str, Any]) -> dict[str, Any]:
-        agents = values.get("agents") or {}
+    @model_validator(mode="after")
+    def _check_agents(self) -> ConfigModel:
+        agents = self.agents
 
         if "unknown-caller" not in agents:
             raise ValueError("Configuration must include an 'unknown-caller' agent")
 
         seen: dict[str, str] = {}
         for agent_name, agent_cfg in agents.items():
-            if isinstance(agent_cfg, dict):
-                numbers = agent_cfg.get("phone_numbers") or []
-            elif isinstance(agent_cfg, AgentConfig):
-                numbers = agent_cfg.phone_numbers or []
-            else:
-                numbers = getattr(agent_cfg, "phone_numbers", None) or []
-
-            for number in numbers:
-                if number in seen:
-                    other = seen[number]
+            for number in agent_cfg.phone_numbers or ():
+                other = seen.setdefault(number, agent_name)
+                if other != agent_name:
                     raise ValueError(
                         f"Duplicate phone number {number!r} defined for agents "
                         f"{agent_name!r} and {other!r}"
                     )
-                seen[number] = agent_name
 
-        return values
+        return self
 
 
 def _coerce_truthy(flag: str | None) -> bool:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -13,7 +15,7 @@ except ImportError:  # Python < 3.11
 from fastapi import FastAPI
 
 from .logging_utils import logger
-from .memory import AgentState, Turn, engine
+from .memory import AgentState, Turn, engine, run_turn_flusher
 from .settings import get_project_name
 
 
@@ -37,5 +39,11 @@ async def lifespan(app: FastAPI):
     Turn.metadata.create_all(engine)
     AgentState.metadata.create_all(engine)
 
+    turn_flusher = asyncio.create_task(run_turn_flusher(), name="turn-flusher")
+
     yield
-    # No shutdown hooks yet; placeholder for future cleanup.
+
+    # Stop the flusher; it writes any turns still queued before exiting.
+    turn_flusher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await turn_flusher
@@ -12,34 +12,39 @@ from typing import Any
 
 __all__ = ["get_highest_caller_name", "logger", "redact_sensitive_data", "setup_logging"]
 
-_DEFAULT_LOG_RECORD_FIELDS = {
-    "args",
-    "asctime",
-    "created",
-    "exc_info",
-    "exc_text",
-    "filename",
-    "funcName",
-    "levelname",
-    "levelno",
-    "lineno",
-    "message",
-    "module",
-    "msecs",
-    "msg",
-    "name",
-    "pathname",
-    "process",
-    "processName",
-    "relativeCreated",
-    "stack_info",
-    "thread",
-    "threadName",
-}
+_DEFAULT_LOG_RECORD_FIELDS = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "exc_text",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "message",
+        "module",
+        "msecs",
+        "msg",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "thread",
+        "threadName",
+    }
+)
 _SENSITIVE_KEY_MARKERS = ("TOKEN", "SECRET", "KEY", "PASSWORD", "ACCOUNT_SID")
 _MIN_SECRET_LENGTH = 6
 _REDACTED_PLACEHOLDER = "***REDACTED***"
 
+# Logger returned by the first argument-less ``setup_logging()`` call.
+_LOGGING_INITIALIZED: logging.Logger | None = None
+
 
 def _collect_secret_values() -> set[str]:
     """Return likely secret values sourced from environment variables."""
@@ -111,10 +116,9 @@ class _SecretFilter(logging.Filter):
         record.args = ()
         record.__dict__["message"] = redacted_message
 
-        for key, value in list(record.__dict__.items()):
-            if key in _DEFAULT_LOG_RECORD_FIELDS:
-                continue
-            record.__dict__[key] = _redact_data(value, secrets)
+        attrs = record.__dict__
+        for key in attrs.keys() - _DEFAULT_LOG_RECORD_FIELDS:
+            attrs[key] = _redact_data(attrs[key], secrets)
         return True
 
 
@@ -167,7 +171,18 @@ def _silence_pydantic_warnings() -> None:
 
 
 def setup_logging(logger: logging.Logger | None = None) -> logging.Logger:
-    """Initialise consistent logging handlers across the application."""
+    """Initialise consistent logging handlers across the application.
+
+    Handler setup only runs once per process; later calls without an explicit
+    *logger* return the logger configured by the first call.
+    """
+
+    global _LOGGING_INITIALIZED
+
+    if logger is None and _LOGGING_INITIALIZED is not None:
+        return _LOGGING_INITIALIZED
+
+    explicit = logger is not None
 
     _silence_pydantic_warnings()
 
@@ -236,6 +251,8 @@ def setup_logging(logger: logging.Logger | None = None) -> logging.Logger:
     _attach_secret_filter(logger)
     _attach_secret_filter(logging.getLogger())
 
+    if not explicit:
+        _LOGGING_INITIALIZED = logger
     return logger
 
 
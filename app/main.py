@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import litellm
+from typing import Any
+
 from fastapi import FastAPI
 
 from app import settings
@@ -66,3 +67,14 @@ app = _create_app()
 
 # Preserve the legacy helper name expected by tests/importers.
 _merge_prosody = merge_prosody
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the ``litellm`` re-export on first access (PEP 562)."""
+
+    if name == "litellm":
+        import litellm
+
+        globals()["litellm"] = litellm
+        return litellm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
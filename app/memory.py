@@ -1,9 +1,16 @@
-import json
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
+from typing import Any, TypeVar
 
+import orjson
+from sqlalchemy import delete, event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Field, Session, SQLModel, create_engine
 
 from log_love import setup_logging
@@ -19,6 +26,39 @@ _db_path.parent.mkdir(parents=True, exist_ok=True)
 
 engine = create_engine(f"sqlite:///{_db_path}", echo=False)
 
+# Async callers hand blocking SQLite work to this single thread so the event
+# loop never waits on disk I/O; one worker also keeps writes serialised.
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memdb")
+
+_T = TypeVar("_T")
+
+
+async def _run_db(func: Callable[..., _T], *args: Any) -> _T:
+    """Run *func* on the database executor and await its result."""
+
+    return await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, func, *args)
+
+
+# Connection pragmas applied once per pooled DBAPI connection. WAL lets readers
+# proceed alongside the per-turn writers and, with synchronous=NORMAL, avoids
+# an fsync on every commit while staying crash-safe.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+@event.listens_for(engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class Turn(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
@@ -28,11 +68,17 @@ class Turn(SQLModel, table=True):
     source: str | None = Field(default=None, index=True)
 
 
+# Core-level insert for turn rows; skips ORM identity-map and flush bookkeeping.
+_TURN_INSERT = Turn.__table__.insert()  # type: ignore[attr-defined]
+
 _TURN_SOURCE_COLUMN_READY = False
 
 
 def _ensure_turn_source_column() -> None:
-    """Ensure the ``turn`` table has a ``source`` column (adds it lazily)."""
+    """Ensure the schema exists and ``turn`` has a ``source`` column.
+
+    Runs once at import; the flag check keeps later calls to a global read.
+    """
 
     global _TURN_SOURCE_COLUMN_READY
     if _TURN_SOURCE_COLUMN_READY:
@@ -55,18 +101,102 @@ def _ensure_turn_source_column() -> None:
     _TURN_SOURCE_COLUMN_READY = True
 
 
+def _turn_row(who: str, text: str, source: str | None) -> dict[str, Any]:
+    return {"ts": datetime.utcnow(), "who": who, "text": text, "source": source}
+
+
 def log_turn(who: str, text: str, *, source: str | None = None) -> None:
     """Persist a single conversational turn."""
 
-    _ensure_schema()
     _ensure_turn_source_column()
 
-    with Session(engine) as sess:
-        turn = Turn(who=who, text=text, source=source)
-        sess.add(turn)
-        sess.commit()
+    with engine.begin() as conn:
+        result = conn.execute(_TURN_INSERT, _turn_row(who, text, source))
+
+    logger.debug("Added turn to db with id=%s", result.inserted_primary_key[0])
+
+
+# ---------------------------------------------------------------------------
+# Batched turn persistence
+# ---------------------------------------------------------------------------
+
+_TURN_BATCH_MAX = 64
+_turn_queue: asyncio.Queue[dict[str, Any]] | None = None
+
+
+def log_turns(rows: list[dict[str, Any]]) -> None:
+    """Persist several turn rows with one executemany and a single commit."""
+
+    _ensure_turn_source_column()
+
+    with engine.begin() as conn:
+        conn.execute(_TURN_INSERT, rows)
+
+    logger.debug("Added %d turns to db", len(rows))
+
+
+async def queue_turn(who: str, text: str, *, source: str | None = None) -> None:
+    """Hand a turn to the background flusher without waiting for the commit.
+
+    When no flusher is running (scripts, endpoint tests without the app
+    lifespan) the turn is written directly on the database executor instead.
+    """
 
-        logger.debug(f"Added turn to db with id={turn.id}")
+    row = _turn_row(who, text, source)
+    if _turn_queue is None:
+        await _run_db(log_turns, [row])
+        return
+    _turn_queue.put_nowait(row)
+
+
+async def run_turn_flusher() -> None:
+    """Drain queued turns in batches until cancelled.
+
+    Each batch holds whatever accumulated while the previous commit ran (up to
+    ``_TURN_BATCH_MAX`` rows), so bursts of turns share one commit. On
+    cancellation the batch being committed is allowed to finish, and turns
+    still queued are written on the database executor before the coroutine
+    exits.
+    """
+
+    global _turn_queue
+
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    _turn_queue = queue
+    # The batch currently being committed. The write is shielded so that a
+    # cancellation arriving while it waits for the executor does not discard
+    # the rows already taken off the queue.
+    in_flight: asyncio.Future[None] | None = None
+    batch: list[dict[str, Any]] = []
+    try:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _TURN_BATCH_MAX:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            in_flight = asyncio.ensure_future(_run_db(log_turns, batch))
+            try:
+                await asyncio.shield(in_flight)
+            except Exception as exc:
+                logger.error("Failed to persist %d queued turns: %s", len(batch), exc)
+            in_flight = None
+    finally:
+        _turn_queue = None
+        pending: list[dict[str, Any]] = []
+        if in_flight is not None:
+            try:
+                await in_flight
+            except BaseException:
+                pending.extend(batch)
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        if pending:
+            try:
+                await _run_db(log_turns, pending)
+            except Exception as exc:
+                logger.error("Failed to persist %d queued turns at shutdown: %s", len(pending), exc)
 
 
 # ---------------------------------------------------------------------------
@@ -85,8 +215,15 @@ class AgentState(SQLModel, table=True):
     messages_json: str
 
 
+_AGENT_STATE_TABLE = AgentState.__table__  # type: ignore[attr-defined]
+
+
 # -------- helper API --------------------------------------------------------
 
+# Session factory for the ORM read path; bound per call so a swapped ``engine``
+# (tests, scripts) is honoured. Writes below use Core statements instead.
+_SessionLocal = sessionmaker(class_=Session, expire_on_commit=False)
+
 
 _SCHEMA_LOCK = Lock()
 _SCHEMA_READY = False
@@ -114,7 +251,7 @@ def load_state(agent_name: str) -> tuple[dict | None, list | None]:
 
     _ensure_schema()
 
-    with Session(engine) as sess:
+    with _SessionLocal(bind=engine) as sess:
         st = sess.get(AgentState, agent_name)
         if not st:
             return None, None
@@ -124,7 +261,7 @@ def load_state(agent_name: str) -> tuple[dict | None, list | None]:
             # Stale – treat as missing so caller starts fresh.
             return None, None
 
-        return json.loads(st.settings_json), json.loads(st.messages_json)
+        return orjson.loads(st.settings_json), orjson.loads(st.messages_json)
 
 
 def save_state(agent_name: str, settings: dict, messages: list) -> None:
@@ -132,22 +269,26 @@ def save_state(agent_name: str, settings: dict, messages: list) -> None:
 
     _ensure_schema()
 
-    rec = AgentState(
-        agent_name=agent_name,
-        settings_json=json.dumps(
+    row = {
+        "agent_name": agent_name,
+        "updated_at": datetime.utcnow(),
+        "settings_json": orjson.dumps(
             {
                 "model": settings.get("model"),
                 "temperature": settings.get("temperature"),
                 "max_tokens": settings.get("max_tokens"),
-            },
-            ensure_ascii=False,
-        ),
-        messages_json=json.dumps(messages, ensure_ascii=False),
+            }
+        ).decode(),
+        "messages_json": orjson.dumps(messages).decode(),
+    }
+    stmt = sqlite_insert(_AGENT_STATE_TABLE).values(row)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["agent_name"],
+        set_={key: stmt.excluded[key] for key in row if key != "agent_name"},
     )
 
-    with Session(engine) as sess:
-        sess.merge(rec)
-        sess.commit()
+    with engine.begin() as conn:
+        conn.execute(stmt)
 
 
 def delete_state(agent_name: str) -> None:
@@ -155,11 +296,29 @@ def delete_state(agent_name: str) -> None:
 
     _ensure_schema()
 
-    with Session(engine) as sess:
-        st = sess.get(AgentState, agent_name)
-        if st:
-            sess.delete(st)
-            sess.commit()
+    with engine.begin() as conn:
+        conn.execute(
+            delete(_AGENT_STATE_TABLE).where(_AGENT_STATE_TABLE.c.agent_name == agent_name)
+        )
+
+
+async def aload_state(agent_name: str) -> tuple[dict | None, list | None]:
+    """Async variant of :func:`load_state` that runs on the database executor."""
+
+    return await _run_db(load_state, agent_name)
+
+
+async def asave_state(agent_name: str, settings: dict, messages: list) -> None:
+    """Async variant of :func:`save_state` that runs on the database executor."""
+
+    await _run_db(save_state, agent_name, settings, messages)
+
+
+async def adelete_state(agent_name: str) -> None:
+    """Async variant of :func:`delete_state` that runs on the database executor."""
+
+    await _run_db(delete_state, agent_name)
 
 
-_ensure_schema()
+# Create tables and apply the turn.source migration before the first write.
+_ensure_turn_source_column()
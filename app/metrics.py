@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import time
+
 from fastapi import APIRouter
 from fastapi.responses import PlainTextResponse
 
 try:  # pragma: no cover - optional dependency
     from prometheus_client import Counter, generate_latest
 except ModuleNotFoundError:  # pragma: no cover - graceful fallback
+    METRICS_ENABLED = False
 
     class _NoopCounter:
-        def __init__(self, *_args, **_kwargs) -> None:
-            return
+        __slots__ = ()
 
         def labels(self, *_args, **_kwargs):
             return self
@@ -19,35 +21,63 @@ except ModuleNotFoundError:  # pragma: no cover - graceful fallback
         def inc(self, *_args, **_kwargs):
             return None
 
+    _NOOP_COUNTER = _NoopCounter()
+
     def Counter(*_args, **_kwargs):  # type: ignore[override]
-        return _NoopCounter()
+        return _NOOP_COUNTER
 
     def generate_latest() -> bytes:
         return b"# metrics disabled -- install prometheus_client to enable\n"
 
+else:
+    METRICS_ENABLED = True
+
 
 router = APIRouter()
 
-# Shared counter used by the WebSocket handler to track message roles.
+# Shared counter used by the WebSocket handler to track message roles. Hot call
+# sites check METRICS_ENABLED first so the no-op fallback costs a single branch.
 METRIC_MESSAGES = Counter("messages_total", "Messages processed", ["role"])
 
 
 @router.get("/healthz", response_class=PlainTextResponse)
-def healthz() -> str:
+def healthz() -> PlainTextResponse:
     """Liveness probe for container orchestrators."""
 
-    return "ok"
+    # Returning a Response skips FastAPI's serialisation of the return value.
+    # It is built per request because the framework may set ``background`` or
+    # adjust headers on the instance it sends.
+    return PlainTextResponse("ok")
 
 
 @router.get("/healthz/", response_class=PlainTextResponse, include_in_schema=False)
-def healthz_trailing_slash() -> str:
+def healthz_trailing_slash() -> PlainTextResponse:
     """Handle load balancers that normalize the health check path with a slash."""
 
     return healthz()
 
 
+# Scrapes arriving within this window share one serialised payload instead of
+# walking every collector again.
+_METRICS_CACHE_TTL_SEC: float = 1.0
+_metrics_cache: tuple[float, bytes] | None = None
+
+
+def _latest_metrics() -> bytes:
+    """Return the exposition payload, regenerating it at most once per TTL."""
+
+    global _metrics_cache
+    now = time.monotonic()
+    cached = _metrics_cache
+    if cached is not None and now - cached[0] < _METRICS_CACHE_TTL_SEC:
+        return cached[1]
+    payload = generate_latest()
+    _metrics_cache = (now, payload)
+    return payload
+
+
 @router.get("/metrics")
 def metrics() -> PlainTextResponse:
     """Expose Prometheus metrics (or a no-op payload when disabled)."""
 
-    return PlainTextResponse(generate_latest(), media_type="text/plain")
+    return PlainTextResponse(_latest_metrics(), media_type="text/plain")
@@ -10,7 +10,7 @@ import re
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelCapabilities:
     """Capabilities and constraints for a specific model family."""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 
 import litellm
 
@@ -12,8 +13,14 @@ logger = logging.getLogger(__name__)
 _TWILIO_INBOUND_PER_MIN: float = float(os.getenv("RINGDOWN_TWILIO_INBOUND_PER_MIN", "0.0085"))
 
 
+@lru_cache(maxsize=256)
 def get_token_prices(model: str) -> tuple[float, float]:
-    """Return (input_cost, output_cost) USD per token for *model*."""
+    """Return (input_cost, output_cost) USD per token for *model*.
+
+    LiteLLM's price sheet is static for the life of the process, so results
+    (including the zeroed fallback) are memoised per model. Call
+    ``get_token_prices.cache_clear()`` after patching the lookup in tests.
+    """
 
     try:
         result = litellm.cost_per_token(model=model)  # type: ignore[call-arg]
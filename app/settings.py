@@ -1,6 +1,10 @@
+import copy
 import os
+import re
+from collections.abc import Mapping
 from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
@@ -11,20 +15,30 @@ from log_love import setup_logging
 
 from .config_schema import ConfigModel, resolve_config_path
 
+try:  # LibYAML-backed parser; several times faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-def get_programmatic_tool_prompts() -> dict[str, str]:
-    """Get tool prompts from the tool registry for interpolation."""
-    from .tool_framework import TOOL_REGISTRY
+# ``{ToolName}`` placeholders interpolated into agent prompts.
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z0-9_-]+)\}")
+# Environment field names whose values are redacted from debug logs.
+_SECRET_KEY_RE = re.compile(r"(api|key|token)", re.IGNORECASE)
 
-    prompts = {}
-    for tool_name, tool_spec in TOOL_REGISTRY.items():
-        if tool_spec.prompt:
-            prompts[tool_name] = tool_spec.prompt
-    return prompts
 
+def get_programmatic_tool_prompts() -> Mapping[str, str]:
+    """Get tool prompts from the tool registry for interpolation.
 
-def build_tool_prompts_for_agent(agent_tools: list[str], tool_header: str) -> str:
-    """Build combined tool prompts for an agent based on enabled tools."""
+    The mapping is cached by the tool framework and is read-only; it reflects
+    code rather than config, so :func:`refresh_config_cache` leaves it alone.
+    """
+    from .tool_framework import get_tool_prompt_map
+
+    return get_tool_prompt_map()
+
+
+@lru_cache(maxsize=64)
+def _build_tool_prompts_cached(tools_key: tuple[str, ...], tool_header: str) -> str:
     parts = []
 
     # Add the tool header first
@@ -33,13 +47,35 @@ def build_tool_prompts_for_agent(agent_tools: list[str], tool_header: str) -> st
 
     # Add prompts for each enabled tool
     programmatic_prompts = get_programmatic_tool_prompts()
-    for tool_name in agent_tools:
+    for tool_name in tools_key:
         if tool_name in programmatic_prompts:
-            parts.append(programmatic_prompts[tool_name].strip())
+            parts.append(programmatic_prompts[tool_name])
 
     return "\n\n".join(parts)
 
 
+# Prompt map the cached tool-prompt blocks and resolved agent configs were
+# built from; a new map means a tool was registered since, so both caches are
+# discarded.
+_tool_prompt_source: Mapping[str, str] | None = None
+
+
+def _sync_tool_prompt_caches() -> None:
+    global _tool_prompt_source
+    prompts = get_programmatic_tool_prompts()
+    if prompts is not _tool_prompt_source:
+        _build_tool_prompts_cached.cache_clear()
+        _resolve_agent_config.cache_clear()
+        _tool_prompt_source = prompts
+
+
+def build_tool_prompts_for_agent(agent_tools: list[str], tool_header: str) -> str:
+    """Build combined tool prompts for an agent based on enabled tools."""
+
+    _sync_tool_prompt_caches()
+    return _build_tool_prompts_cached(tuple(agent_tools), tool_header)
+
+
 class EnvSettings(BaseSettings):
     """Secrets and environment-specific values.
 
@@ -87,8 +123,6 @@ logger = setup_logging()
 def get_env() -> EnvSettings:
     """Return cached environment settings with sensitive values redacted in logs."""
 
-    import re
-
     try:
         env_settings = EnvSettings()
     except ValidationError as exc:  # noqa: BLE001 – fail fast when credentials are absent
@@ -115,7 +149,7 @@ def get_env() -> EnvSettings:
 
     redacted = {}
     for k, v in env_settings.model_dump().items():
-        if re.search(r"(api|key|token)", k, re.IGNORECASE):
+        if _SECRET_KEY_RE.search(k):
             redacted[k] = "REDACTED"
         else:
             redacted[k] = v
@@ -144,13 +178,25 @@ def _config_path() -> Path:
     return path
 
 
+# (path, mtime_ns, size) of the file behind the cached configuration.
+_config_signature: tuple[Path, int, int] | None = None
+
+
+def _stat_signature(path: Path) -> tuple[Path, int, int]:
+    st = path.stat()
+    return path, st.st_mtime_ns, st.st_size
+
+
 @lru_cache
 def _load_config_model() -> ConfigModel:
     """Load and validate the configuration using :mod:`pydantic`."""
 
+    global _config_signature
+
     path = _config_path()
-    with path.open("r", encoding="utf-8") as fp:
-        raw_data: dict[str, Any] = yaml.safe_load(fp) or {}
+    _config_signature = _stat_signature(path)
+    # One sized read; LibYAML then parses the bytes without a text wrapper.
+    raw_data: dict[str, Any] = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
 
     try:
         return ConfigModel.model_validate(raw_data)
@@ -161,7 +207,11 @@ def _load_config_model() -> ConfigModel:
 
 @lru_cache
 def _load_config() -> dict[str, Any]:
-    """Return the validated configuration as a plain dictionary."""
+    """Return the validated configuration as a plain dictionary.
+
+    Only the agent merge needs the YAML-shaped dict; the scalar helpers below
+    read attributes from :func:`_load_config_model` instead.
+    """
 
     return _load_config_model().model_dump(mode="python")
 
@@ -172,11 +222,26 @@ def _load_config() -> dict[str, Any]:
 
 
 def refresh_config_cache() -> None:
-    """Clear cached configuration so subsequent calls reload from disk."""
+    """Drop cached configuration if config.yaml changed since it was loaded.
+
+    The file is identified by its resolved path, mtime and size, so calling
+    this on every request (e.g. from a hot-reload hook) costs one ``stat``
+    while the file is unchanged. Pointing ``RINGDOWN_CONFIG_PATH`` at another
+    file changes the path and therefore also triggers a reload.
+    """
 
     _config_path.cache_clear()
+    if _config_signature is not None:
+        try:
+            if _stat_signature(_config_path()) == _config_signature:
+                return
+        except FileNotFoundError:
+            pass
+
     _load_config.cache_clear()
     _load_config_model.cache_clear()
+    _resolve_agent_config.cache_clear()
+    _phone_index.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -187,8 +252,7 @@ def refresh_config_cache() -> None:
 def get_default_bot_name() -> str:
     """Return the default *bot_name* from config.yaml (title-cased)."""
 
-    cfg = _load_config()
-    name: str | None = cfg.get("defaults", {}).get("bot_name")
+    name = _load_config_model().defaults.bot_name
     if not name:
         # Fallback – keep legacy placeholder rather than raising
         return "Botname"
@@ -199,30 +263,26 @@ def get_default_bot_name() -> str:
 
 def get_default_email() -> str:
     """Return the default email address from config defaults."""
-    cfg = _load_config()
-    email = cfg.get("defaults", {}).get("default_email")
+    email = _load_config_model().defaults.default_email
     if not email:
         raise ValueError("default_email missing in config.yaml defaults")
-    return str(email).strip()
+    return email.strip()
 
 
 def get_admin_emails() -> list[str]:
     """Return list of green-listed admin email patterns from config defaults."""
-    cfg = _load_config()
-    return cfg.get("defaults", {}).get("admin_emails", [])
+    return list(_load_config_model().defaults.admin_emails)
 
 
 def get_project_name() -> str:
     """Return the project identifier from config defaults."""
-    cfg = _load_config()
-    project = cfg.get("defaults", {}).get("project_name")
-    return str(project).strip() if project else "Project"
+    project = _load_config_model().defaults.project_name
+    return project.strip() if project else "Project"
 
 
 def get_calendar_user_name() -> str:
     """Return the friendly user name referenced in calendar prompts."""
-    cfg = _load_config()
-    return str(cfg.get("defaults", {}).get("calendar_user_name", "User")).strip()
+    return _load_config_model().defaults.calendar_user_name.strip()
 
 
 def _merge_with_defaults(agent_cfg: dict[str, Any], defaults: dict[str, Any]) -> dict[str, Any]:
@@ -231,8 +291,7 @@ def _merge_with_defaults(agent_cfg: dict[str, Any], defaults: dict[str, Any]) ->
     merged = defaults.copy()
 
     # Ignore explicit ``None`` overrides so defaults remain in effect.
-    overlay = {k: v for k, v in (agent_cfg or {}).items() if v is not None}
-    merged.update(overlay)
+    merged.update((k, v) for k, v in (agent_cfg or {}).items() if v is not None)
 
     # ------------------------------------------------------------------
     # Tool merging must happen BEFORE prompt interpolation
@@ -261,39 +320,34 @@ def _merge_with_defaults(agent_cfg: dict[str, Any], defaults: dict[str, Any]) ->
             merged["tools"] = agent_tools
         else:
             # Agent adds new tools – union with defaults, preserving order & uniqueness
-            combined: list[str] = []
-            seen: set[str] = set()
-
-            for t in default_tools + agent_tools:
-                if t not in seen:
-                    combined.append(t)
-                    seen.add(t)
-
-            merged["tools"] = combined
+            merged["tools"] = list(dict.fromkeys(default_tools + agent_tools))
 
     # ------------------------------------------------------------------
     # Prompt placeholder interpolation: `{ToolName}` -> defaults.tool_prompts[ToolName]
     # Now uses the correct final tools list for {ToolPrompts}
     # ------------------------------------------------------------------
 
-    import re
-
     prompt_template = merged.get("prompt")
 
-    if prompt_template:
-        # Ensure prompt is a string (YAML block scalars already produce str)
-        if isinstance(prompt_template, list):
-            prompt_template = "\n".join(prompt_template)
-
-        # Build mapping of available placeholder -> text
+    # Ensure prompt is a string (YAML block scalars already produce str)
+    if isinstance(prompt_template, list):
+        prompt_template = "\n".join(prompt_template)
+        merged["prompt"] = prompt_template
+
+    # str.format_map is not used here: it would also rewrite ``{{``/``}}`` and
+    # reject format specs in user-authored prompts. Prompts without any brace
+    # skip placeholder resolution entirely instead.
+    if prompt_template and "{" in prompt_template:
+        # Build mapping of available placeholder -> text. Every value is
+        # stripped on the way in so substitution can insert it as-is.
         tool_prompts: dict[str, str] = {}
-        # First, add programmatic prompts from tool registry
+        # First, add programmatic prompts from tool registry (pre-stripped)
         tool_prompts.update(get_programmatic_tool_prompts())
         # Add the tool header from config
         if "tool_header" in defaults:
-            tool_prompts["ToolHeader"] = defaults["tool_header"]
+            tool_prompts["ToolHeader"] = defaults["tool_header"].strip()
         if "tool_header" in merged:
-            tool_prompts["ToolHeader"] = merged["tool_header"]
+            tool_prompts["ToolHeader"] = merged["tool_header"].strip()
 
         # Build combined ToolPrompts based on agent's enabled tools
         # Now uses the correct merged tools list!
@@ -305,35 +359,36 @@ def _merge_with_defaults(agent_cfg: dict[str, Any], defaults: dict[str, Any]) ->
             )
 
         # Legacy support: Then, add config-based prompts (can override programmatic ones)
-        tool_prompts.update(defaults.get("tool_prompts", {}) or {})
-        # Agent-specific overrides/extra prompts allowed
-        tool_prompts.update(merged.get("tool_prompts", {}) or {})
-
-        pattern = re.compile(r"\{([A-Za-z0-9_-]+)\}")
+        for overrides in (defaults.get("tool_prompts"), merged.get("tool_prompts")):
+            # Agent-specific overrides/extra prompts come last
+            tool_prompts.update((k, v.strip()) for k, v in (overrides or {}).items())
 
-        def _sub(match: re.Match[str]):
-            key = match.group(1)
-            if key in tool_prompts:
-                return tool_prompts[key].strip()
+        def _sub(match: re.Match[str]) -> str:
             # Leave unknown placeholders (e.g., dynamic ones like {time_utc}) intact.
-            return match.group(0)
+            return tool_prompts.get(match[1], match[0])
 
-        merged["prompt"] = pattern.sub(_sub, prompt_template)
+        merged["prompt"] = _PLACEHOLDER_RE.sub(_sub, prompt_template)
 
     return merged
 
 
-def get_agent_config(agent_name: str) -> dict[str, Any]:
-    """Return fully-merged config for `agent_name` (defaults applied)."""
+@lru_cache(maxsize=64)
+def _resolve_agent_config(agent_name: str) -> MappingProxyType:
+    """Merge *agent_name* with the defaults once per loaded configuration.
+
+    The merge copies dicts, unions tool lists and interpolates the whole
+    prompt, so the result is memoised and exposed read-only; public helpers
+    hand callers a deep copy they are free to mutate. The cache is dropped
+    when the config reloads or the tool-prompt map changes.
+    """
 
     cfg = _load_config()
-    defaults = cfg["defaults"]
     agents = cfg["agents"]
 
     if agent_name not in agents:
         raise KeyError(f"Agent '{agent_name}' missing in config.yaml")
 
-    merged = _merge_with_defaults(agents[agent_name], defaults)
+    merged = _merge_with_defaults(agents[agent_name], cfg["defaults"])
     logger.debug(
         "Agent '%s' config resolved: %s",
         agent_name,
@@ -342,7 +397,27 @@ def get_agent_config(agent_name: str) -> dict[str, Any]:
             for k, v in merged.items()
         },
     )
-    return merged
+    return MappingProxyType(merged)
+
+
+def get_agent_config(agent_name: str) -> dict[str, Any]:
+    """Return fully-merged config for `agent_name` (defaults applied)."""
+
+    _sync_tool_prompt_caches()
+    # Deep copy: nested values (``tools``, ``tts_prosody``) are shared with
+    # the cached config and must not be mutated through the result.
+    return copy.deepcopy(dict(_resolve_agent_config(agent_name)))
+
+
+@lru_cache
+def _phone_index() -> dict[str, str]:
+    """Return a caller-number -> agent-name map built once per configuration."""
+
+    index: dict[str, str] = {}
+    for name, agent_cfg in _load_config()["agents"].items():
+        for number in agent_cfg.get("phone_numbers") or []:
+            index.setdefault(number, name)
+    return index
 
 
 def get_agent_for_number(caller_number: str | None) -> tuple[str, dict[str, Any]]:
@@ -352,20 +427,15 @@ def get_agent_for_number(caller_number: str | None) -> tuple[str, dict[str, Any]
     If no agent matches, the special 'unknown-caller' agent is used.
     """
 
-    cfg = _load_config()
-    defaults = cfg["defaults"]
-
-    agents = cfg["agents"]
-
-    for name, agent_cfg in agents.items():
-        if caller_number and caller_number in (agent_cfg.get("phone_numbers") or []):
-            return name, _merge_with_defaults(agent_cfg, defaults)
+    name = _phone_index().get(caller_number) if caller_number else None
+    if name is not None:
+        return name, get_agent_config(name)
 
     # Fallback
-    if "unknown-caller" not in agents:
+    if "unknown-caller" not in _load_config()["agents"]:
         raise KeyError("'unknown-caller' agent must be defined in config.yaml")
 
-    return "unknown-caller", _merge_with_defaults(agents["unknown-caller"], defaults)
+    return "unknown-caller", get_agent_config("unknown-caller")
 
 
 def get_tools_list(agent_name: str) -> list[str]:
@@ -24,12 +24,18 @@ import inspect
 import json
 import logging
 import os
+import sys
 import threading
 import traceback
-from collections.abc import Callable, Sequence
-from functools import wraps
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -39,8 +45,13 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-class _ToolSpec(BaseModel):
-    """Metadata for a registered tool."""
+@dataclass(slots=True, frozen=True)
+class _ToolSpec:
+    """Metadata for a registered tool.
+
+    A frozen slotted dataclass: specs are built once by ``register_tool`` and
+    then only read, on every tool call.
+    """
 
     name: str
     description: str
@@ -50,9 +61,9 @@ class _ToolSpec(BaseModel):
     async_execution: bool = False
     category: str = "input"
 
-    model_config = {
-        "arbitrary_types_allowed": True,
-    }
+    # Built on first use (eagerly by ``register_tool``); param models are fixed
+    # once registered, so the schema never needs regenerating.
+    _schema: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def openai_schema(self) -> dict[str, Any]:
         """Return OpenAI-compatible JSON schema dict for this tool.
@@ -62,7 +73,14 @@ class _ToolSpec(BaseModel):
         - OpenAI (supports both formats)
         - Anthropic (requires draft 2020-12 format)
         - Gemini (via LiteLLM translation)
+
+        The dict is cached and shared between callers; copy before mutating.
         """
+        if self._schema is None:
+            object.__setattr__(self, "_schema", self._build_openai_schema())
+        return self._schema  # type: ignore[return-value]
+
+    def _build_openai_schema(self) -> dict[str, Any]:
         # Use JSON Schema draft 2020-12 compatible $defs format for maximum compatibility
         schema = self.param_model.model_json_schema(ref_template="#/$defs/{model}")
 
@@ -70,14 +88,11 @@ class _ToolSpec(BaseModel):
         schema["$schema"] = "https://json-schema.org/draft/2020-12/schema"
 
         # Ensure basic required fields
-        if "type" not in schema:
-            schema["type"] = "object"
-        if "properties" not in schema:
-            schema["properties"] = {}
+        schema.setdefault("type", "object")
+        schema.setdefault("properties", {})
 
         # Set strict validation for better provider compatibility
-        if "additionalProperties" not in schema:
-            schema["additionalProperties"] = False
+        schema.setdefault("additionalProperties", False)
 
         return {
             "type": "function",
@@ -92,26 +107,55 @@ class _ToolSpec(BaseModel):
 # Global mapping name -> ToolSpec
 TOOL_REGISTRY: dict[str, _ToolSpec] = {}
 
-# Global storage for current agent context to support async execution
-_current_agent_context: dict[str, Any] | None = None
+# Active agent configuration. A ContextVar keeps each call's task isolated and
+# follows work handed to threads via asyncio.to_thread or copy_context().
+_agent_ctx: ContextVar[dict[str, Any] | None] = ContextVar("agent_ctx", default=None)
 _current_call_context: dict[str, Any] | None = None
 
-# Global registry for async tool results and callbacks
-_async_tool_registry: dict[str, dict[str, Any]] = {}
+
+@dataclass(slots=True)
+class _AsyncRecord:
+    """Outcome and completion callback for one async tool execution."""
+
+    result: Any = None
+    status: str = "pending"
+    callback: Callable[[str, Any], None] | None = None
+
+
+# Global registry for async tool results and callbacks. Worker threads and the
+# chat loop both touch entries, so create-or-update goes through the lock.
+_async_tool_registry: dict[str, _AsyncRecord] = {}
+_async_lock = threading.RLock()
+
+# Async tools run on a shared, bounded pool so bursts reuse worker threads
+# instead of creating one per call.
+_TOOL_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RINGDOWN_TOOL_WORKERS", "16")),
+    thread_name_prefix="ringdown-tool",
+)
 
 
 # Function to register a callback for async tool completion
 def register_async_callback(async_id: str, callback: Any) -> None:
     """Register a callback to be called when an async tool completes."""
-    if async_id not in _async_tool_registry:
-        _async_tool_registry[async_id] = {}
-    _async_tool_registry[async_id]["callback"] = callback
+    with _async_lock:
+        _async_tool_registry.setdefault(async_id, _AsyncRecord()).callback = callback
 
 
 # Function to get the result of an async tool
 def get_async_result(async_id: str) -> dict[str, Any] | None:
     """Get the result of an async tool execution if available."""
-    return _async_tool_registry.get(async_id, {}).get("result")
+    record = _async_tool_registry.get(async_id)
+    return None if record is None else record.result
+
+
+def _finish_async(async_id: str, result: Any, status: str) -> Callable[[str, Any], None] | None:
+    """Store the outcome for *async_id* and return its registered callback."""
+    with _async_lock:
+        record = _async_tool_registry.setdefault(async_id, _AsyncRecord())
+        record.result = result
+        record.status = status
+        return record.callback
 
 
 # ---------------------------------------------------------------------------
@@ -158,7 +202,7 @@ def register_tool(
                 f"Tool '{name}' category must be 'input' or 'output', got '{category}'"
             )
 
-        TOOL_REGISTRY[name] = _ToolSpec(
+        spec = _ToolSpec(
             name=name,
             description=description,
             param_model=param_model,
@@ -167,6 +211,10 @@ def register_tool(
             async_execution=async_execution,
             category=cat_value,
         )
+        # Pay schema generation at import time rather than on the first turn.
+        spec.openai_schema()
+        TOOL_REGISTRY[name] = spec
+        clear_tool_caches()
         logger.debug("Registered tool '%s'", name)
 
         @wraps(func)
@@ -189,6 +237,7 @@ def list_tools() -> list[str]:
     return list(TOOL_REGISTRY.keys())
 
 
+@lru_cache(maxsize=128)
 def get_tool_schema(name: str) -> dict[str, Any]:
     """Return OpenAI-compatible JSON schema for a tool by name."""
     if name not in TOOL_REGISTRY:
@@ -196,6 +245,7 @@ def get_tool_schema(name: str) -> dict[str, Any]:
     return TOOL_REGISTRY[name].openai_schema()
 
 
+@lru_cache(maxsize=128)
 def get_tool_prompt(name: str) -> str:
     """Return the prompt documentation for a tool by name."""
     if name not in TOOL_REGISTRY:
@@ -204,114 +254,273 @@ def get_tool_prompt(name: str) -> str:
     return spec.prompt or f"Tool '{name}' has no prompt documentation."
 
 
+@lru_cache(maxsize=1)
+def get_tool_prompt_map() -> Mapping[str, str]:
+    """Return a read-only ``{tool name: prompt}`` map for tools with prompts.
+
+    Prompts are stripped here, once, and the map is reused until the next
+    :func:`register_tool` call.
+    """
+
+    return MappingProxyType(
+        {name: spec.prompt.strip() for name, spec in TOOL_REGISTRY.items() if spec.prompt}
+    )
+
+
+# Resolved schema lists keyed by an agent's tool names; cleared on registration.
+_agent_tools_cache: dict[tuple[str, ...], tuple[dict[str, Any], ...]] = {}
+
+
+@lru_cache(maxsize=1)
+def _call_context_setters() -> tuple[tuple[str, Callable[[Any], None]], ...]:
+    """Return ``(module name, set_call_context)`` for each opted-in tool module.
+
+    Resolved lazily, once per registry state, so context switches do not walk
+    every tool module. Modules registering several tools appear once.
+    """
+
+    setters: dict[str, Callable[[Any], None]] = {}
+    for spec in TOOL_REGISTRY.values():
+        mod_name = getattr(spec.func, "__module__", None)
+        if mod_name is None or mod_name in setters:
+            continue
+        mod = sys.modules.get(mod_name)
+        setter = getattr(mod, "set_call_context", None)
+        if callable(setter):
+            setters[mod_name] = setter
+    return tuple(setters.items())
+
+
+def clear_tool_caches() -> None:
+    """Drop registry-derived caches (schemas, prompts, context setters)."""
+
+    get_tool_schema.cache_clear()
+    get_tool_prompt.cache_clear()
+    get_tool_prompt_map.cache_clear()
+    _agent_tools_cache.clear()
+    _call_context_setters.cache_clear()
+
+
 def get_tools_for_agent(agent_cfg: dict[str, Any]) -> list[dict[str, Any]]:
     """Return list of OpenAI tool schemas enabled for this agent.
 
     `agent_cfg` should contain an optional `tools` key: list[str].  If
-    absent or empty, no tools are enabled.
+    absent or empty, no tools are enabled.  The schema dicts are shared
+    with the registry; copy before mutating.
     """
 
     names: Sequence[str] = agent_cfg.get("tools", [])
-    schemas: list[dict[str, Any]] = []
+    key = tuple(names)
+    schemas = _agent_tools_cache.get(key)
 
-    for n in names:
-        if n not in TOOL_REGISTRY:
-            raise KeyError(f"Tool '{n}' referenced by agent but not registered")
-        schemas.append(TOOL_REGISTRY[n].openai_schema())
+    if schemas is None:
+        for n in key:
+            if n not in TOOL_REGISTRY:
+                raise KeyError(f"Tool '{n}' referenced by agent but not registered")
+        schemas = tuple(TOOL_REGISTRY[n].openai_schema() for n in key)
+        _agent_tools_cache[key] = schemas
 
-    return schemas
+    return list(schemas)
 
 
-def _truncate_tool_response(result: Any) -> Any:
-    """Truncate tool response to 200k characters if needed."""
-    try:
-        # Convert result to JSON string to check length
-        result_json = json.dumps(result, ensure_ascii=False)
+_TOOL_RESPONSE_MAX_CHARS = 200000
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-        # Check if truncation is needed
-        if len(result_json) <= 200000:
-            return result
 
-        # Calculate how many characters were removed
-        chars_removed = len(result_json) - 200000
+def _json_len(obj: Any) -> int:
+    """Return the length of ``json.dumps(obj, ensure_ascii=False)``.
 
-        # Create truncation notice
-        truncation_notice = (
-            "[TRUNCATED: "
-            f"{chars_removed} more characters removed; "
-            "be sure to mention this to the user.]"
+    Containers are measured entry by entry so the ", " and ": " separators of
+    the stdlib's default formatting are counted exactly; the truncation budget
+    is calibrated against that output, not orjson's compact form. Scalars are
+    measured with orjson, decoded so non-ASCII text counts one per character.
+    Floats and values orjson rejects (e.g. integers wider than 64 bits) use the
+    stdlib encoder.
+    """
+
+    if isinstance(obj, dict):
+        return _container_len(
+            [_json_len(str(key)) + 2 + _json_len(value) for key, value in obj.items()]
         )
+    if isinstance(obj, (list, tuple)):
+        return _container_len([_json_len(item) for item in obj])
+    if isinstance(obj, float):
+        return len(_JSON_ENCODER.encode(obj))
+    try:
+        return len(orjson.dumps(obj, option=_ORJSON_OPTIONS).decode())
+    except orjson.JSONEncodeError:
+        return len(_JSON_ENCODER.encode(obj))
+
+
+def _json_preview(obj: Any, limit: int = 500) -> str:
+    """Return the first *limit* bytes of *obj* as JSON for debug logs."""
+
+    try:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)[:limit].decode("utf-8", errors="replace")
+    except orjson.JSONEncodeError:
+        return str(obj)[:limit]
+
+
+class _Trunc:
+    """Log argument rendering ``_json_preview(obj, limit)`` only when formatted.
+
+    Passed as a ``%s`` argument, the serialise-and-slice work is skipped for
+    records no handler accepts.
+    """
+
+    __slots__ = ("_obj", "_limit")
+
+    def __init__(self, obj: Any, limit: int = 500) -> None:
+        self._obj = obj
+        self._limit = limit
+
+    def __str__(self) -> str:
+        return _json_preview(self._obj, self._limit)
+
+
+def _truncation_notice(total_len: int) -> str:
+    chars_removed = total_len - _TOOL_RESPONSE_MAX_CHARS
+    return (
+        "[TRUNCATED: "
+        f"{chars_removed} more characters removed; "
+        "be sure to mention this to the user.]"
+    )
+
 
-        # Try to be smarter about truncation for different data types
-        if isinstance(result, str):
-            # For strings, truncate the original string and add notice
-            # Account for JSON quotes and escape sequences
-            max_content_length = (
-                200000 - len(json.dumps("")) - len(truncation_notice) - 10
-            )  # safety buffer
-            if max_content_length > 0:
-                truncated_str = result[:max_content_length]
-                return truncated_str + "\n\n" + truncation_notice
-            else:
-                return truncation_notice
-
-        elif isinstance(result, dict):
-            # For dicts, try to preserve structure by truncating string values
-            truncated_dict = {}
-            remaining_chars = 200000 - len(truncation_notice) - 100  # safety buffer
-
-            for key, value in result.items():
-                key_json = json.dumps({key: value})
-                if len(json.dumps(truncated_dict)) + len(key_json) < remaining_chars:
-                    truncated_dict[key] = value
-                else:
-                    # Try to add a truncated version of this key-value pair
-                    if isinstance(value, str) and len(value) > 100:
-                        truncated_value = value[:100] + "..."
-                        truncated_dict[key] = truncated_value
-                    elif not truncated_dict:  # Ensure we have at least one key
-                        truncated_dict[key] = (
-                            str(value)[:100] + "..." if len(str(value)) > 100 else value
-                        )
-                    break
-
-            truncated_dict["_truncation_notice"] = truncation_notice
-            return truncated_dict
-
-        elif isinstance(result, list):
-            # For lists, include as many complete items as possible
-            truncated_list = []
-            remaining_chars = 200000 - len(truncation_notice) - 100  # safety buffer
-
-            for item in result:
-                item_json = json.dumps(item)
-                if len(json.dumps(truncated_list)) + len(item_json) < remaining_chars:
-                    truncated_list.append(item)
-                else:
-                    # Try to add a truncated version of this item
-                    if isinstance(item, str) and len(item) > 100:
-                        truncated_list.append(item[:100] + "...")
-                    elif not truncated_list:  # Ensure we have at least one item
-                        truncated_list.append(
-                            str(item)[:100] + "..." if len(str(item)) > 100 else item
-                        )
-                    break
-
-            truncated_list.append(truncation_notice)
-            return truncated_list
+def _container_len(entry_lens: list[int]) -> int:
+    # Brackets plus the ", " separators json.dumps puts between entries; dict
+    # entry lengths already include their ": " separator.
+    return 2 + sum(entry_lens) + 2 * max(len(entry_lens) - 1, 0)
+
+
+def _keep(result: Any) -> Any:
+    # Scalars can never exceed the budget, so skip serialising them.
+    return result
+
+
+def _truncate_str(result: str) -> str:
+    # JSON escaping grows a character to at most six, so short strings can
+    # never exceed the budget and need no serialisation.
+    if 6 * len(result) + 2 <= _TOOL_RESPONSE_MAX_CHARS:
+        return result
+    total_len = _json_len(result)
+    if total_len <= _TOOL_RESPONSE_MAX_CHARS:
+        return result
 
+    # Truncate the original string and add notice, accounting for JSON quotes
+    # and escape sequences
+    truncation_notice = _truncation_notice(total_len)
+    max_content_length = _TOOL_RESPONSE_MAX_CHARS - 2 - len(truncation_notice) - 10  # safety buffer
+    if max_content_length > 0:
+        return result[:max_content_length] + "\n\n" + truncation_notice
+    return truncation_notice
+
+
+def _truncate_dict(result: dict[Any, Any]) -> dict[Any, Any]:
+    if not result:
+        return result
+    entry_lens = [_json_len(str(key)) + 2 + _json_len(value) for key, value in result.items()]
+    total_len = _container_len(entry_lens)
+    if total_len <= _TOOL_RESPONSE_MAX_CHARS:
+        return result
+
+    # Preserve structure by keeping whole entries while the budget allows
+    truncation_notice = _truncation_notice(total_len)
+    truncated_dict = {}
+    remaining_chars = _TOOL_RESPONSE_MAX_CHARS - len(truncation_notice) - 100
+    used_chars = 2
+
+    for (key, value), entry_len in zip(result.items(), entry_lens, strict=True):
+        if used_chars + entry_len < remaining_chars:
+            truncated_dict[key] = value
+            used_chars += entry_len + 2
+        else:
+            # Try to add a truncated version of this key-value pair
+            if isinstance(value, str) and len(value) > 100:
+                truncated_dict[key] = value[:100] + "..."
+            elif not truncated_dict:  # Ensure we have at least one key
+                truncated_dict[key] = str(value)[:100] + "..." if len(str(value)) > 100 else value
+            break
+
+    truncated_dict["_truncation_notice"] = truncation_notice
+    return truncated_dict
+
+
+def _truncate_list(result: list[Any]) -> list[Any]:
+    if not result:
+        return result
+    entry_lens = [_json_len(item) for item in result]
+    total_len = _container_len(entry_lens)
+    if total_len <= _TOOL_RESPONSE_MAX_CHARS:
+        return result
+
+    # Include as many complete items as possible
+    truncation_notice = _truncation_notice(total_len)
+    truncated_list = []
+    remaining_chars = _TOOL_RESPONSE_MAX_CHARS - len(truncation_notice) - 100
+    used_chars = 2
+
+    for item, item_len in zip(result, entry_lens, strict=True):
+        if used_chars + item_len < remaining_chars:
+            truncated_list.append(item)
+            used_chars += item_len + 2
         else:
-            # For other types, convert to string and truncate
-            str_result = str(result)
-            max_content_length = 200000 - len(truncation_notice) - 10
-            if max_content_length > 0:
-                return str_result[:max_content_length] + "\n\n" + truncation_notice
-            else:
-                return truncation_notice
+            # Try to add a truncated version of this item
+            if isinstance(item, str) and len(item) > 100:
+                truncated_list.append(item[:100] + "...")
+            elif not truncated_list:  # Ensure we have at least one item
+                truncated_list.append(str(item)[:100] + "..." if len(str(item)) > 100 else item)
+            break
 
+    truncated_list.append(truncation_notice)
+    return truncated_list
+
+
+def _truncate_other(result: Any) -> Any:
+    total_len = _json_len(result)
+    if total_len <= _TOOL_RESPONSE_MAX_CHARS:
+        return result
+
+    # Convert to string and truncate
+    truncation_notice = _truncation_notice(total_len)
+    max_content_length = _TOOL_RESPONSE_MAX_CHARS - len(truncation_notice) - 10
+    if max_content_length > 0:
+        return str(result)[:max_content_length] + "\n\n" + truncation_notice
+    return truncation_notice
+
+
+# Exact-type dispatch for ``_truncate_tool_response``; subclasses (rare) fall
+# back to an isinstance scan, and anything else to ``_truncate_other``.
+_TRUNCATORS: dict[type, Callable[[Any], Any]] = {
+    type(None): _keep,
+    bool: _keep,
+    int: _keep,
+    float: _keep,
+    str: _truncate_str,
+    dict: _truncate_dict,
+    list: _truncate_list,
+}
+
+
+def _truncate_tool_response(result: Any) -> Any:
+    """Truncate tool response to 200k characters if needed.
+
+    Handlers are picked by exact type. Dict values and list items are
+    serialised exactly once: their encoded lengths give both the total size
+    and the running budget used to decide how much of the container to keep.
+    """
+    handler = _TRUNCATORS.get(type(result))
+    if handler is None:
+        handler = next(
+            (h for t, h in _TRUNCATORS.items() if isinstance(result, t)), _truncate_other
+        )
+
+    try:
+        return handler(result)
     except Exception as exc:
         # If anything goes wrong with truncation, log and return original
-        logger.error(f"Failed to truncate tool response: {exc}")
+        logger.error("Failed to truncate tool response: %s", exc)
         return result
 
 
@@ -322,6 +531,23 @@ def _get_default_error_email() -> str:
     return _get_email()
 
 
+# Arguments quoted in error emails are capped; the traceback carries the detail.
+_ERROR_EMAIL_ARGS_MAX_CHARS = 4000
+
+
+def _format_error_args(raw_args: dict[str, Any]) -> str:
+    """Return *raw_args* as indented JSON, capped for inclusion in an email."""
+
+    try:
+        text = orjson.dumps(raw_args, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode()
+    except orjson.JSONEncodeError:
+        text = json.dumps(raw_args, indent=2, default=str)
+    if len(text) > _ERROR_EMAIL_ARGS_MAX_CHARS:
+        omitted = len(text) - _ERROR_EMAIL_ARGS_MAX_CHARS
+        text = f"{text[:_ERROR_EMAIL_ARGS_MAX_CHARS]}\n... [{omitted} characters truncated]"
+    return text
+
+
 def _send_error_email(tool_name: str, raw_args: dict[str, Any], error: Exception) -> None:
     """Send an email about a tool execution error."""
     try:
@@ -332,14 +558,14 @@ def _send_error_email(tool_name: str, raw_args: dict[str, Any], error: Exception
 
         # Check if we can send to this email address
         if not _is_recipient_allowed(error_email):
-            logger.error(f"Cannot send error email to {error_email} - not in greenlist")
+            logger.error("Cannot send error email to %s - not in greenlist", error_email)
             return
 
         # Format the error message
         error_msg = (
             f"Tool Execution Error\n\n"
             f"Tool: {tool_name}\n"
-            f"Arguments: {json.dumps(raw_args, indent=2)}\n\n"
+            f"Arguments: {_format_error_args(raw_args)}\n\n"
             f"Error: {str(error)}\n\n"
             f"Full traceback:\n{traceback.format_exc()}"
         )
@@ -354,92 +580,67 @@ def _send_error_email(tool_name: str, raw_args: dict[str, Any], error: Exception
         )
 
         send_email(email_args)
-        logger.info(f"Sent error email for tool {tool_name} to {error_email}")
+        logger.info("Sent error email for tool %s to %s", tool_name, error_email)
 
     except Exception as e:
-        logger.error(f"Failed to send error email for tool {tool_name}: {e}")
+        logger.error("Failed to send error email for tool %s: %s", tool_name, e)
 
 
 def _execute_tool_async(
     name: str,
+    args_obj: BaseModel,
     raw_args: dict[str, Any],
     spec: _ToolSpec,
     async_id: str,
-    preflight_payload: Any | None,
 ) -> None:
-    """Execute a tool asynchronously in a background thread."""
-    # Capture the current agent context from module-level storage
-    current_agent_context = _current_agent_context
+    """Execute a tool asynchronously on the shared tool pool.
+
+    *args_obj* has already been validated by the caller; *raw_args* is kept
+    only for the error email.
+    """
+    current_agent_context = _agent_ctx.get()
 
     if current_agent_context is None:
-        logger.warning(f"No agent context available for async tool {name}")
+        logger.warning("No agent context available for async tool %s", name)
     else:
-        logger.debug(f"Captured agent context for async tool {name}: {current_agent_context}")
+        logger.debug("Captured agent context for async tool %s: %s", name, current_agent_context)
 
     def async_execution():
         try:
-            # Restore agent context in the new thread by calling set_agent_context
-            # This will propagate to all tools that need it
-            if current_agent_context is not None:
-                logger.debug(f"Restoring agent context in async thread for tool {name}")
-                # Import here to avoid circular imports
-                set_agent_context(current_agent_context)
-            else:
-                logger.warning(f"No agent context to restore for async tool {name}")
-
-            # Validate and execute the tool
-            args_obj = spec.param_model(**raw_args)
-            if preflight_payload is not None:
-                try:
-                    object.__setattr__(args_obj, "_preflight_payload", preflight_payload)
-                except Exception:
-                    args_obj._preflight_payload = preflight_payload
-            logger.info(f"Executing tool {name} asynchronously with args={args_obj}")
+            logger.info("Executing tool %s asynchronously with args=%s", name, args_obj)
             result = spec.func(args_obj)
-            logger.info(f"Async tool {name} completed successfully")
+            logger.info("Async tool %s completed successfully", name)
 
             # Log result preview for debugging
-            try:
-                preview = json.dumps(result)[:500]
-            except Exception:
-                preview = str(result)[:500]
-            logger.debug(f"Async tool {name} result preview: {preview}")
+            logger.debug("Async tool %s result preview: %s", name, _Trunc(result))
 
             # Store the result in the registry
-            if async_id not in _async_tool_registry:
-                _async_tool_registry[async_id] = {}
-            _async_tool_registry[async_id]["result"] = result
-            _async_tool_registry[async_id]["status"] = "completed"
+            callback = _finish_async(async_id, result, "completed")
 
             # Call the callback if registered
-            callback = _async_tool_registry.get(async_id, {}).get("callback")
             if callback:
                 try:
                     callback(async_id, result)
                 except Exception as e:
-                    logger.error(f"Error calling async callback for {name}: {e}")
+                    logger.error("Error calling async callback for %s: %s", name, e)
 
         except Exception as e:
-            logger.error(f"Async tool {name} failed: {e}")
+            logger.error("Async tool %s failed: %s", name, e)
             _send_error_email(name, raw_args, e)
 
             # Store the error in the registry
-            if async_id not in _async_tool_registry:
-                _async_tool_registry[async_id] = {}
-            _async_tool_registry[async_id]["result"] = {"success": False, "error": str(e)}
-            _async_tool_registry[async_id]["status"] = "failed"
+            callback = _finish_async(async_id, {"success": False, "error": str(e)}, "failed")
 
             # Call the callback with error
-            callback = _async_tool_registry.get(async_id, {}).get("callback")
             if callback:
                 try:
                     callback(async_id, {"success": False, "error": str(e)})
                 except Exception as cb_e:
-                    logger.error(f"Error calling async error callback for {name}: {cb_e}")
+                    logger.error("Error calling async error callback for %s: %s", name, cb_e)
 
-    # Start the async execution in a background thread
-    thread = threading.Thread(target=async_execution, daemon=True)
-    thread.start()
+    # Start the async execution on the shared tool pool, carrying the caller's
+    # context (including the agent config) into the worker thread.
+    future = _TOOL_POOL.submit(copy_context().run, async_execution)
 
     # Allow async workers a brief head-start so tests observing side effects
     # immediately after `execute_tool` return see the expected behaviour.
@@ -448,7 +649,7 @@ def _execute_tool_async(
     except ValueError:
         wait_hint = 0.0
     if wait_hint > 0:
-        thread.join(wait_hint)
+        wait((future,), timeout=wait_hint)
 
 
 def execute_tool(name: str, raw_args: dict[str, Any]) -> Any:
@@ -457,14 +658,6 @@ def execute_tool(name: str, raw_args: dict[str, Any]) -> Any:
     if name not in TOOL_REGISTRY:
         raise KeyError(f"Tool '{name}' not registered")
 
-    # Propagate current agent context to thread-local storage so that any
-    # Pydantic validators executed in this thread have access to it.
-    if _current_agent_context is not None:
-        try:
-            set_agent_context(_current_agent_context)
-        except Exception as exc:
-            logger.error(f"Failed to propagate agent context in execute_tool: {exc}")
-
     spec = TOOL_REGISTRY[name]
 
     # Handle async execution
@@ -487,12 +680,14 @@ def execute_tool(name: str, raw_args: dict[str, Any]) -> Any:
                 "tool_name": name,
             }
 
-        preflight_payload = None
         preflight = getattr(spec.func, "preflight_check", None)
         if callable(preflight):
             ready, message, *extra = preflight()
-            if extra:
-                preflight_payload = extra[0]
+            if extra and extra[0] is not None:
+                try:
+                    object.__setattr__(args_obj, "_preflight_payload", extra[0])
+                except Exception:
+                    args_obj._preflight_payload = extra[0]
             if not ready:
                 return {
                     "success": False,
@@ -509,7 +704,7 @@ def execute_tool(name: str, raw_args: dict[str, Any]) -> Any:
         async_id = str(uuid.uuid4())
 
         # Start async execution with the ID
-        _execute_tool_async(name, raw_args, spec, async_id, preflight_payload)
+        _execute_tool_async(name, args_obj, raw_args, spec, async_id)
 
         # Return immediately with a pending status that includes the ID
         return {
@@ -529,7 +724,7 @@ def execute_tool(name: str, raw_args: dict[str, Any]) -> Any:
         logger.error("Invalid args for tool %s: %s", name, exc)
         raise
 
-    logger.info(f"Executing tool {name} with args={args_obj}")
+    logger.info("Executing tool %s with args=%s", name, args_obj)
     result = spec.func(args_obj)
 
     # Build a concise preview for logs without assuming the result is
@@ -540,16 +735,12 @@ def execute_tool(name: str, raw_args: dict[str, Any]) -> Any:
         _len = None
 
     if _len is not None:
-        logger.info(f"Result received. Length: {_len}")
+        logger.info("Result received. Length: %s", _len)
     else:
         logger.info("Result received (scalar value)")
 
     # Truncate verbose output for hygiene
-    try:
-        preview = json.dumps(result)[:500]
-    except Exception:  # noqa: BLE001
-        preview = str(result)[:500]
-    logger.debug(preview)
+    logger.debug("%s", _Trunc(result))
 
     # Universal truncation for all tool responses
     result = _truncate_tool_response(result)
@@ -567,7 +758,6 @@ def _auto_import_app_tools() -> None:
 
     import importlib
     import pkgutil
-    import sys
 
     try:
         import app.tools as _tools_pkg  # pylint: disable=import-error
@@ -595,39 +785,27 @@ _auto_import_app_tools()
 
 
 def set_agent_context(agent_cfg: dict[str, Any] | None) -> None:
-    """Propagate *agent_cfg* to all registered tools that expose a
-    ``set_agent_context`` callable.
+    """Make *agent_cfg* the active agent configuration for tool calls.
 
-    Tools can opt-in by defining a module-level ``set_agent_context`` function
-    that accepts a single argument (the agent configuration dict or ``None``).
-
-    This helper lets the chat loop set and later clear context for **all** such
-    tools without importing them individually.  New tools therefore get the
-    context automatically – no core-loop changes required.
+    The value lives in a ContextVar, so it follows the current asyncio task and
+    any work it hands to threads. Tools read it through
+    :func:`get_agent_context`; no per-module propagation is needed.
     """
 
-    # Store the context at module level for async tools
-    global _current_agent_context
-    _current_agent_context = agent_cfg
+    _agent_ctx.set(agent_cfg)
 
     # Log agent context details
     if agent_cfg:
-        logger.info(f"Setting agent context with bot_name: {agent_cfg.get('bot_name', 'NOT SET')}")
-        logger.debug(f"Full agent context: {agent_cfg}")
+        logger.info("Setting agent context with bot_name: %s", agent_cfg.get("bot_name", "NOT SET"))
+        logger.debug("Full agent context: %s", agent_cfg)
     else:
         logger.info("Clearing agent context (set to None)")
 
-    for spec in TOOL_REGISTRY.values():
-        mod = inspect.getmodule(spec.func)
-        if mod is None:  # pragma: no cover – should not occur
-            continue
-        setter = getattr(mod, "set_agent_context", None)
-        if callable(setter):
-            try:
-                setter(agent_cfg)
-                logger.debug(f"Set agent context on module {mod.__name__}")
-            except Exception as exc:  # noqa: BLE001 – do not fail app for one tool
-                logger.exception("%s.set_agent_context failed: %s", mod.__name__, exc)
+
+def get_agent_context() -> dict[str, Any] | None:
+    """Return the active agent configuration, or ``None`` when unset."""
+
+    return _agent_ctx.get()
 
 
 def set_call_context(call_ctx: dict[str, Any] | None) -> None:
@@ -636,14 +814,9 @@ def set_call_context(call_ctx: dict[str, Any] | None) -> None:
     global _current_call_context
     _current_call_context = call_ctx
 
-    for spec in TOOL_REGISTRY.values():
-        mod = inspect.getmodule(spec.func)
-        if mod is None:  # pragma: no cover – defensive guard
-            continue
-        setter = getattr(mod, "set_call_context", None)
-        if callable(setter):
-            try:
-                setter(call_ctx)
-                logger.debug("Set call context on module %s", mod.__name__)
-            except Exception as exc:  # noqa: BLE001 – keep processing other tools
-                logger.exception("%s.set_call_context failed: %s", mod.__name__, exc)
+    for mod_name, setter in _call_context_setters():
+        try:
+            setter(call_ctx)
+            logger.debug("Set call context on module %s", mod_name)
+        except Exception as exc:  # noqa: BLE001 – keep processing other tools
+            logger.exception("%s.set_call_context failed: %s", mod_name, exc)
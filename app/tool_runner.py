@@ -28,11 +28,15 @@ import asyncio
 import contextlib
 import logging
 import random
+from collections import deque
 from collections.abc import AsyncIterator, Callable, Mapping
 from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# Thinking sounds pre-sampled per RNG call while a tool runs.
+_SOUND_BATCH = 32
+
 
 class ToolEvent(NamedTuple):
     """Lightweight event emitted by :py:meth:`ToolRunner.run`."""
@@ -116,39 +120,27 @@ class ToolRunner:
 
         # If the tool finishes very quickly (<interval) we skip thinking sounds.
         thinking_sounds = self.sound_list(tool_name)
-        first_wait = True
-
-        result: Any | None = None
+        # Draw sounds in batches so long-running tools hit the RNG once per
+        # _SOUND_BATCH intervals rather than every interval.
+        sound_buffer: deque[str] = deque()
 
         try:
-            while True:
-                try:
-                    await asyncio.wait_for(asyncio.shield(tool_task), timeout=self._interval)
-                    # Reached if task completed without Timing out – success or error
-                    break
-                except TimeoutError:
-                    # Task still running.
-                    if thinking_sounds:
-                        sound = random.choice(thinking_sounds)
-                        logger.debug("ToolRunner: thinking sound '%s'", sound)
-                        yield ToolEvent("thinking", text=sound)
-                    # Emit at most once immediately if tool is quick so users
-                    # perceive responsiveness.
-                    if first_wait:
-                        first_wait = False
-                    continue
-                except Exception as exc:  # Tool raised whilst awaiting
-                    logger.exception("Tool '%s' raised during wait: %s", tool_name, exc)
-                    result = {"error": str(exc)}
-                    break
-
-            # Ensure we have result if not captured yet
-            if result is None:
-                try:
-                    result = tool_task.result()
-                except Exception as exc:  # noqa: BLE001 – capture for downstream handling
-                    logger.exception("Tool '%s' raised: %s", tool_name, exc)
-                    result = {"error": str(exc)}
+            # We own the task, so wait on it directly: no shield or per-interval
+            # wait_for timeout wrapper is needed.
+            while not tool_task.done():
+                done, _ = await asyncio.wait({tool_task}, timeout=self._interval)
+                if not done and thinking_sounds:
+                    if not sound_buffer:
+                        sound_buffer.extend(random.choices(thinking_sounds, k=_SOUND_BATCH))
+                    sound = sound_buffer.popleft()
+                    logger.debug("ToolRunner: thinking sound '%s'", sound)
+                    yield ToolEvent("thinking", text=sound)
+
+            try:
+                result = tool_task.result()
+            except Exception as exc:  # noqa: BLE001 – capture for downstream handling
+                logger.exception("Tool '%s' raised: %s", tool_name, exc)
+                result = {"error": str(exc)}
 
             yield ToolEvent("result", data=result)
         finally:
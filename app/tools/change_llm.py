@@ -5,35 +5,24 @@ during conversation, changing the underlying AI model being used.
 """
 
 import logging
-import threading
+import sys
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from .. import tool_framework as _tf
 from ..tool_framework import register_tool
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Agent context – populated by tool_framework.set_agent_context
+# Agent context – read from the tool framework
 # ---------------------------------------------------------------------------
 
-_agent_context = threading.local()
-
-
-def set_agent_context(agent_config: dict[str, Any] | None) -> None:
-    """Store the current agent configuration in thread-local storage.
-
-    This is called automatically by the tool framework before the tool
-    executes, allowing `change_llm` to read the active model when
-    constructing its response.
-    """
-    _agent_context.config = agent_config
-
 
 def _get_agent_context() -> dict[str, Any] | None:
-    """Return the agent configuration for the current thread, if any."""
-    return getattr(_agent_context, "config", None)
+    """Return the active agent configuration, if any."""
+    return _tf.get_agent_context()
 
 
 _ALIAS_MAP: dict[str, str] = {
@@ -139,6 +128,59 @@ _MODEL_CONFIGS: dict[str, dict[str, Any]] = {
 }
 
 
+# Intern aliases and canonical names so validator output and template keys
+# share one string object per model.
+_ALIAS_MAP = {sys.intern(alias): sys.intern(choice) for alias, choice in _ALIAS_MAP.items()}
+
+
+def _result_template(config: dict[str, Any]) -> dict[str, Any]:
+    settings: dict[str, Any] = {
+        "temperature": config["temperature"],
+        "max_tokens": config["max_tokens"],
+    }
+    if config.get("thinking_level"):
+        settings["thinking_level"] = config["thinking_level"]
+    return {
+        "action": "model_changed",
+        "previous_model": None,  # filled per call
+        "new_model": config["model_id"],
+        "model_label": config["label"],
+        "settings": settings,
+        "message": f"Switched to {config['label']}.\n\n",
+    }
+
+
+# Fully built tool results per canonical model; each call copies one and fills
+# in the previous model.
+_RESULT_TEMPLATES: dict[str, dict[str, Any]] = {
+    sys.intern(choice): _result_template(config) for choice, config in _MODEL_CONFIGS.items()
+}
+
+
+# Common spellings of every alias (dash, space or underscore separated; lower,
+# upper or title case) resolved up front, so typical inputs need one lookup.
+_CANONICAL_MAP: dict[str, str] = {
+    variant: choice
+    for alias, choice in _ALIAS_MAP.items()
+    for spelling in (alias, alias.replace("-", " "), alias.replace("-", "_"))
+    for variant in (spelling, spelling.upper(), spelling.title())
+}
+
+
+def _normalise_model_choice(value: str) -> str:
+    """Map a user-supplied model name to its canonical ``_MODEL_CONFIGS`` key."""
+
+    canonical = _CANONICAL_MAP.get(value.strip())
+    if canonical is not None:
+        return canonical
+
+    cleaned = value.strip().lower().replace("_", "-")
+    cleaned = "-".join(part for part in cleaned.replace(" ", "-").split("-") if part)
+    if cleaned not in _ALIAS_MAP:
+        raise ValueError(f"Unsupported model choice: {value}")
+    return _ALIAS_MAP[cleaned]
+
+
 class ChangeLLMArgs(BaseModel):
     """Arguments for the change LLM tool."""
 
@@ -153,11 +195,7 @@ class ChangeLLMArgs(BaseModel):
     @field_validator("model_choice")
     @classmethod
     def normalise_model_choice(cls, value: str) -> str:
-        cleaned = value.strip().lower().replace("_", "-")
-        cleaned = "-".join(part for part in cleaned.replace(" ", "-").split("-") if part)
-        if cleaned not in _ALIAS_MAP:
-            raise ValueError(f"Unsupported model choice: {value}")
-        return _ALIAS_MAP[cleaned]
+        return _normalise_model_choice(value)
 
 
 @register_tool(
@@ -182,37 +220,25 @@ def change_llm(args: ChangeLLMArgs) -> dict[str, Any]:
         Dict containing the model change confirmation and new settings
     """
 
-    logger.info(f"User requested LLM model change to: {args.model_choice}")
+    logger.info("User requested LLM model change to: %s", args.model_choice)
 
     model_choice = args.model_choice
-
-    config = _MODEL_CONFIGS[model_choice]
+    template = _RESULT_TEMPLATES[model_choice]
 
     # Determine the model currently in use so we can include it in the response
     agent_ctx = _get_agent_context()
     is_mapping = isinstance(agent_ctx, dict)
     previous_model = agent_ctx.get("model") if is_mapping and agent_ctx.get("model") else "unknown"
 
-    result = {
-        "action": "model_changed",
-        "previous_model": previous_model,
-        "new_model": config["model_id"],
-        "model_label": config["label"],
-        "settings": {
-            "temperature": config["temperature"],
-            "max_tokens": config["max_tokens"],
-        },
-        "message": (f"Switched to {config['label']}.\n\n"),
-    }
-
-    thinking_level = config.get("thinking_level")
-    if thinking_level:
-        result["settings"]["thinking_level"] = thinking_level
+    # Callers may mutate the result, so copy the template and its settings
+    result = template.copy()
+    result["previous_model"] = previous_model
+    result["settings"] = template["settings"].copy()
 
     logger.info(
         "Model change completed: %s with temp=%s",
         model_choice,
-        config["temperature"],
+        result["settings"]["temperature"],
     )
 
     return result
@@ -24,7 +24,6 @@ import json
 import logging
 import os
 import re
-import threading
 from email.message import EmailMessage
 from typing import Any
 
@@ -36,6 +35,7 @@ from ratelimit import limits, sleep_and_retry
 from app import settings as _settings
 from app.settings import get_admin_emails, get_default_bot_name, get_default_email
 
+from .. import tool_framework as _tf
 from ..tool_framework import register_tool
 
 
@@ -51,7 +51,7 @@ _DEFAULT_ENFORCED = bool(
 
 
 def _get_agent_context() -> dict[str, Any] | None:
-    return getattr(_agent_context, "config", None)
+    return _tf.get_agent_context()
 
 
 logger = logging.getLogger(__name__)
@@ -72,17 +72,8 @@ def _send_gmail(service, raw: str):
     return service.users().messages().send(userId="me", body={"raw": raw}).execute()
 
 
-# Thread-local storage for agent context
-_agent_context = threading.local()
-
-
-def set_agent_context(agent_config: dict[str, Any] | None) -> None:
-    """Set the current agent configuration in thread-local storage."""
-    _agent_context.config = agent_config
-
-
 def get_agent_context() -> dict[str, Any] | None:
-    """Get the current agent configuration from thread-local storage."""
+    """Get the active agent configuration from the tool framework."""
     return _get_agent_context()
 
 
@@ -236,9 +227,7 @@ def _resolve_service_account_credentials(
                 "GMAIL_SA_KEY_PATH points to missing file or invalid JSON; "
                 f"value begins with {key_reference[:32]!r}."
             ) from exc
-        credentials = service_account.Credentials.from_service_account_info(
-            key_data, scopes=scopes
-        )
+        credentials = service_account.Credentials.from_service_account_info(key_data, scopes=scopes)
 
     if dry_run:
         return credentials
@@ -354,7 +343,7 @@ def send_email(args: EmailArgs) -> dict[str, Any]:
 
         result = _send_gmail(service, raw)
 
-        logger.info(f"Email sent successfully to {args.to}, id: {result['id']}")
+        logger.info("Email sent successfully to %s, id: %s", args.to, result["id"])
 
         return {"success": True, "message_id": result["id"], "to": args.to, "subject": subject}
 
@@ -368,7 +357,7 @@ def send_email(args: EmailArgs) -> dict[str, Any]:
             "async_execution": False,
         }
     except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        logger.error("Failed to send email: %s", e)
         return {"success": False, "error": str(e)}
 
 
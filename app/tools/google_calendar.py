@@ -20,7 +20,6 @@ import json
 import logging
 import os
 import re
-import threading
 from datetime import UTC, datetime, timedelta
 from functools import lru_cache
 from typing import Any
@@ -33,6 +32,7 @@ from pydantic import BaseModel, Field, field_validator
 from app import settings as _app_settings  # to fetch config defaults
 from app.settings import get_calendar_user_name as _get_cal_name
 
+from .. import tool_framework as _tf
 from ..tool_framework import register_tool
 
 logger = logging.getLogger(__name__)
@@ -43,19 +43,12 @@ class CalendarIntegrationDisabled(RuntimeError):
 
 
 # ---------------------------------------------------------------------------
-# Thread-local agent context
+# Agent context (held by the tool framework)
 # ---------------------------------------------------------------------------
 
-_agent_context = threading.local()
-
-
-def set_agent_context(agent_config: dict[str, Any] | None) -> None:
-    """Store agent config (contains bot_name, etc.) in thread-local."""
-    _agent_context.config = agent_config
-
 
 def get_agent_context() -> dict[str, Any] | None:
-    return getattr(_agent_context, "config", None)
+    return _tf.get_agent_context()
 
 
 # ---------------------------------------------------------------------------
@@ -247,6 +240,12 @@ def _dt_to_rfc3339(dt: datetime) -> str:
     return dt.isoformat()
 
 
+def _parse_rfc3339(value: str) -> datetime:
+    # Python 3.11+ fromisoformat (C implementation) accepts the trailing 'Z'
+    # and fractional seconds Google returns, so no normalisation pass is needed.
+    return datetime.fromisoformat(value)
+
+
 def _build_reminders(minutes: int) -> dict[str, Any]:
     return {
         "useDefault": False,
@@ -511,11 +510,6 @@ def update_calendar_event(args: UpdateEventArgs) -> dict[str, Any]:
             event["end"]["dateTime"] = _dt_to_rfc3339(end_dt)
         elif args.start_time is not None:
             # shift start & end preserving original duration
-            # RFC3339 times may include trailing 'Z' which datetime.fromisoformat
-            # in Python <3.11 does not accept. Normalise 'Z' → '+00:00'.
-            def _parse_rfc3339(s: str) -> datetime:
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
-
             orig_start = _parse_rfc3339(event["start"]["dateTime"])
             orig_end = _parse_rfc3339(event["end"]["dateTime"])
             delta = orig_end - orig_start
@@ -524,9 +518,6 @@ def update_calendar_event(args: UpdateEventArgs) -> dict[str, Any]:
             event["end"]["dateTime"] = _dt_to_rfc3339(new_end)
         elif args.duration_minutes is not None:
             # adjust duration preserving start
-            def _parse_rfc3339(s: str) -> datetime:
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
-
             start_dt = _parse_rfc3339(event["start"]["dateTime"])
             event["end"]["dateTime"] = _dt_to_rfc3339(
                 start_dt + timedelta(minutes=args.duration_minutes)
@@ -31,14 +31,12 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 from pydantic import BaseModel, Field, field_validator
 
+from .. import tool_framework as _tf
 from ..tool_framework import register_tool
 from .email import EmailArgs, send_email
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for agent context
-_agent_context = threading.local()
-
 # Google API scopes needed for Docs and Drive operations
 # - documents: Full access to Google Docs for create/read/edit operations
 # - drive.file: Create and manage files created by the app (for CreateGoogleDoc, AppendGoogleDoc)
@@ -178,23 +176,17 @@ def _find_in_text(text: str, needle: str, *, max_chars: int) -> dict[str, Any]:
     }
 
 
-def set_agent_context(agent_config: dict[str, Any] | None) -> None:
-    """Set the current agent configuration in thread-local storage."""
-    logger.debug(f"Google Docs: set_agent_context called with config: {agent_config}")
-    _agent_context.config = agent_config
-
-
 def get_agent_context() -> dict[str, Any] | None:
-    """Get the current agent configuration from thread-local storage."""
-    ctx = getattr(_agent_context, "config", None)
-    logger.debug(f"Google Docs: get_agent_context returning: {ctx}")
+    """Get the active agent configuration from the tool framework."""
+    ctx = _tf.get_agent_context()
+    logger.debug("Google Docs: get_agent_context returning: %s", ctx)
     return ctx
 
 
 def _get_allowed_folders() -> list[str]:
     """Get allowed folders for the current agent."""
     agent_config = get_agent_context()
-    logger.debug(f"Google Docs: _get_allowed_folders called, agent_config: {agent_config}")
+    logger.debug("Google Docs: _get_allowed_folders called, agent_config: %s", agent_config)
 
     if not agent_config:
         logger.error("Google Docs: No agent context available in _get_allowed_folders")
@@ -203,7 +195,7 @@ def _get_allowed_folders() -> list[str]:
     # Check for docs_folder_greenlist in agent config
     folder_list = agent_config.get("docs_folder_greenlist")
     if folder_list:
-        logger.debug(f"Google Docs: Using custom folder greenlist: {folder_list}")
+        logger.debug("Google Docs: Using custom folder greenlist: %s", folder_list)
         return folder_list
 
     # Generate default folder list based on agent's bot_name
@@ -215,7 +207,9 @@ def _get_allowed_folders() -> list[str]:
     default_folders = [
         f"{bot_name}-default",  # Dynamic folder name based on bot_name
     ]
-    logger.debug(f"Google Docs: Using default folders for bot_name '{bot_name}': {default_folders}")
+    logger.debug(
+        "Google Docs: Using default folders for bot_name '%s': %s", bot_name, default_folders
+    )
     return default_folders
 
 
@@ -330,7 +324,7 @@ def _find_or_create_folder(folder_name: str, drive_service: Any | None = None) -
     # Create new folder
     file_metadata = {"name": folder_name, "mimeType": "application/vnd.google-apps.folder"}
     folder = drive_service.files().create(body=file_metadata, fields="id").execute()
-    logger.info(f"Created new folder '{folder_name}' with ID: {folder['id']}")
+    logger.info("Created new folder '%s' with ID: %s", folder_name, folder["id"])
     return folder["id"]
 
 
@@ -500,12 +494,12 @@ class CreateDocArgs(BaseModel):
 )
 def create_google_doc(args: CreateDocArgs) -> dict[str, Any]:
     """Create a new Google Doc."""
-    logger.info(f"CreateGoogleDoc called with args: {args}")
-    logger.debug(f"Current thread ID: {threading.get_ident()}")
+    logger.info("CreateGoogleDoc called with args: %s", args)
+    logger.debug("Current thread ID: %s", threading.get_ident())
 
     # Check agent context right at the start
     ctx = get_agent_context()
-    logger.info(f"CreateGoogleDoc: Agent context at start: {ctx}")
+    logger.info("CreateGoogleDoc: Agent context at start: %s", ctx)
 
     try:
         allowed_folders = _get_allowed_folders()
@@ -594,7 +588,7 @@ def create_google_doc(args: CreateDocArgs) -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to create document: {e}")
+        logger.error("Failed to create document: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -602,8 +596,7 @@ class SearchDriveArgs(BaseModel):
     query: str = Field(
         ...,
         description=(
-            "Text to match when searching Google Drive. Use defaults unless "
-            "specified otherwise."
+            "Text to match when searching Google Drive. Use defaults unless specified otherwise."
         ),
     )
     titles_only: bool = Field(
@@ -761,7 +754,7 @@ def search_google_drive(args: SearchDriveArgs) -> dict[str, Any]:
         }
 
     except Exception as exc:
-        logger.error(f"Failed to search Google Drive: {exc}")
+        logger.error("Failed to search Google Drive: %s", exc)
         return {"success": False, "error": str(exc)}
 
 
@@ -826,7 +819,7 @@ def read_google_doc(args: ReadDocArgs) -> dict[str, Any]:
                 if isinstance(raw_metadata, dict):
                     metadata = raw_metadata
             except Exception as meta_exc:  # pragma: no cover - metadata fetch is best effort
-                logger.debug(f"Failed to retrieve metadata for {doc_id}: {meta_exc}")
+                logger.debug("Failed to retrieve metadata for %s: %s", doc_id, meta_exc)
 
             mime_type = metadata.get("mimeType")
             title = metadata.get("name", "Untitled")
@@ -890,7 +883,7 @@ def read_google_doc(args: ReadDocArgs) -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to read document: {e}")
+        logger.error("Failed to read document: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -910,12 +903,12 @@ class AppendDocArgs(BaseModel):
 )
 def append_google_doc(args: AppendDocArgs) -> dict[str, Any]:
     """Append content to a document (only in default folder for security)."""
-    logger.info(f"AppendGoogleDoc called with args: {args}")
-    logger.debug(f"Current thread ID: {threading.get_ident()}")
+    logger.info("AppendGoogleDoc called with args: %s", args)
+    logger.debug("Current thread ID: %s", threading.get_ident())
 
     # Check agent context right at the start
     ctx = get_agent_context()
-    logger.info(f"AppendGoogleDoc: Agent context at start: {ctx}")
+    logger.info("AppendGoogleDoc: Agent context at start: %s", ctx)
 
     try:
         docs_service, _ = _get_services()
@@ -948,7 +941,7 @@ def append_google_doc(args: AppendDocArgs) -> dict[str, Any]:
             documentId=doc_id, body={"requests": requests}
         ).execute()
 
-        logger.info(f"Appended content to document {doc_id}")
+        logger.info("Appended content to document %s", doc_id)
 
         return {
             "success": True,
@@ -958,5 +951,5 @@ def append_google_doc(args: AppendDocArgs) -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to update document: {e}")
+        logger.error("Failed to update document: %s", e)
         return {"success": False, "error": str(e)}
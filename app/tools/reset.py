@@ -5,27 +5,18 @@ hear the onboarding message again.
 """
 
 import logging
-import threading
 from typing import Any
 
 from pydantic import BaseModel
 
+from .. import tool_framework as _tf
 from ..tool_framework import register_tool
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage so the tool can honour whichever agent invoked it.
-_agent_context = threading.local()
-
-
-def set_agent_context(agent_config: dict[str, Any] | None) -> None:
-    """Capture the active agent configuration for subsequent tool calls."""
-
-    _agent_context.config = agent_config
-
 
 def _get_agent_context() -> dict[str, Any] | None:
-    return getattr(_agent_context, "config", None)
+    return _tf.get_agent_context()
 
 
 class ResetArgs(BaseModel):
@@ -9,9 +9,10 @@ Both tools are registered with ``app.tool_framework`` at import time.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
-import requests
+import httpx
 from pydantic import BaseModel, Field, field_validator
 
 from ..tool_framework import register_tool
@@ -23,6 +24,25 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _BASE_URL = "https://api.tavily.com"
+_SEARCH_URL = f"{_BASE_URL}/search"
+_EXTRACT_URL = f"{_BASE_URL}/extract"
+
+# Fixed request fields that are not exposed to the LLM.
+_SEARCH_FIXED_FIELDS: dict[str, Any] = {
+    "include_answer": False,
+    "topic": "general",
+    "search_depth": "advanced",
+    "chunks_per_source": 1,
+}
+_EXTRACT_FIXED_FIELDS: dict[str, Any] = {
+    "extract_depth": "advanced",
+    "format": "markdown",
+}
+
+# Shared client so consecutive tool calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP + TLS handshake per request. HTTP/2 lets
+# concurrent tool calls multiplex over a single connection to the API host.
+_CLIENT = httpx.Client(http2=True)
 
 
 def _auth_headers() -> dict[str, str]:
@@ -33,6 +53,13 @@ def _auth_headers() -> dict[str, str]:
     key = get_env().tavily_api_key  # type: ignore[attr-defined]
     if not key:
         raise RuntimeError("TAVILY_API_KEY missing in environment")
+    return _bearer_headers(key)
+
+
+@lru_cache(maxsize=4)
+def _bearer_headers(key: str) -> dict[str, str]:
+    """Build the header dict once per API key; callers must not mutate it."""
+
     # Tavily switched to bearer-token authentication in March 2025. Older
     # `x-api-key` headers now return HTTP 401. Use the current scheme so our
     # tools continue to work without requiring config changes.
@@ -87,16 +114,9 @@ are other pages with more information, use tavily_search again.
   your search, this is invaluable.""",
 )
 def tavily_search(args: SearchArgs) -> dict[str, Any]:
-    url = f"{_BASE_URL}/search"
-    payload = args.model_dump(exclude_none=True)
-    # Always set include_answer=False (not exposed to LLM)
-    payload["include_answer"] = False
-    # Hardcoded values - only set non-None values
-    payload["topic"] = "general"
-    payload["search_depth"] = "advanced"
-    payload["chunks_per_source"] = 1
+    payload = {**args.model_dump(exclude_none=True), **_SEARCH_FIXED_FIELDS}
     logger.debug("TavilySearch payload=%s", payload)
-    resp = requests.post(url, headers=_auth_headers(), json=payload, timeout=args.timeout)
+    resp = _CLIENT.post(_SEARCH_URL, headers=_auth_headers(), json=payload, timeout=args.timeout)
     if resp.status_code != 200:
         raise RuntimeError(f"TavilySearch HTTP {resp.status_code}: {resp.text}")
     return resp.json()
@@ -141,13 +161,9 @@ there are other pages with more information, use tavily_search.
 getting full page text.""",
 )
 def tavily_extract(args: ExtractArgs) -> dict[str, Any]:
-    url = f"{_BASE_URL}/extract"
-    payload = args.model_dump(exclude_none=True)
-    # Hardcoded values - only set non-None values
-    payload["extract_depth"] = "advanced"
-    payload["format"] = "markdown"
+    payload = {**args.model_dump(exclude_none=True), **_EXTRACT_FIXED_FIELDS}
     logger.debug("TavilyExtract payload=%s", payload)
-    resp = requests.post(url, headers=_auth_headers(), json=payload, timeout=args.timeout)
+    resp = _CLIENT.post(_EXTRACT_URL, headers=_auth_headers(), json=payload, timeout=args.timeout)
     if resp.status_code != 200:
         raise RuntimeError(f"TavilyExtract HTTP {resp.status_code}: {resp.text}")
     return resp.json()
@@ -98,6 +98,96 @@ def test_twilml_unknown_caller():
     assert unknown_cfg["welcome_greeting"] in xml
 
 
+def test_agent_for_number_uses_phone_index():
+    """Known numbers route to their agent; anything else gets unknown-caller."""
+
+    name, cfg = app_settings.get_agent_for_number(PRIMARY_NUMBER)
+    assert name == _PRIMARY_AGENT_NAME
+    assert PRIMARY_NUMBER in cfg["phone_numbers"]
+
+    for caller in (UNKNOWN_NUM, None, ""):
+        assert app_settings.get_agent_for_number(caller)[0] == "unknown-caller"
+
+
+def test_prompt_interpolation_preserves_literal_braces():
+    """Only known ``{Name}`` placeholders are replaced; other braces stay verbatim."""
+
+    defaults = {"tools": [], "tool_prompts": {"Greeting": "  hello  "}}
+    template = '{Greeting} at {time_utc}; json: {{"a": 1}} and {0:>3}'
+
+    merged = app_settings._merge_with_defaults({"prompt": template}, defaults)
+    assert merged["prompt"] == 'hello at {time_utc}; json: {{"a": 1}} and {0:>3}'
+
+    plain = app_settings._merge_with_defaults({"prompt": ["line one", "line two"]}, defaults)
+    assert plain["prompt"] == "line one\nline two"
+
+
+def test_refresh_config_cache_reloads_only_on_change(tmp_path):
+    """refresh_config_cache keeps the cached model until the file changes."""
+
+    config_copy = tmp_path / "config.yaml"
+    config_copy.write_bytes(app_settings._config_path().read_bytes())
+
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("RINGDOWN_CONFIG_PATH", str(config_copy))
+            app_settings.refresh_config_cache()
+            first = app_settings._load_config_model()
+
+            app_settings.refresh_config_cache()
+            assert app_settings._load_config_model() is first
+
+            config_copy.write_text(
+                config_copy.read_text(encoding="utf-8") + "\n# touched\n", encoding="utf-8"
+            )
+            app_settings.refresh_config_cache()
+            assert app_settings._load_config_model() is not first
+    finally:
+        app_settings.refresh_config_cache()
+
+
+def test_agent_config_copies_are_independent():
+    """Mutating one resolved agent config must not leak into later lookups."""
+
+    first = app_settings.get_agent_config(_PRIMARY_AGENT_NAME)
+    first["model"] = "mutated/model"
+    first["welcome_greeting"] = "mutated"
+
+    first["tools"].append("mutated_tool")
+    first.setdefault("tts_prosody", {})["rate"] = "mutated"
+
+    second = app_settings.get_agent_config(_PRIMARY_AGENT_NAME)
+    assert second is not first
+    assert second["model"] != "mutated/model"
+    assert second["welcome_greeting"] != "mutated"
+    assert "mutated_tool" not in second["tools"]
+    assert second.get("tts_prosody", {}).get("rate") != "mutated"
+
+
+def test_agent_config_reresolved_after_tool_registration():
+    """Registering a tool changes the prompt map, so cached agents are rebuilt."""
+
+    from pydantic import BaseModel
+
+    from app import tool_framework as tf
+
+    app_settings.get_agent_config(_PRIMARY_AGENT_NAME)
+    cached = app_settings._resolve_agent_config(_PRIMARY_AGENT_NAME)
+
+    class _ProbeArgs(BaseModel):
+        pass
+
+    tf.register_tool(
+        name="test_agent_prompt_probe", description="probe", param_model=_ProbeArgs, prompt="p"
+    )(lambda _args: None)
+    try:
+        app_settings.get_agent_config(_PRIMARY_AGENT_NAME)
+        assert app_settings._resolve_agent_config(_PRIMARY_AGENT_NAME) is not cached
+    finally:
+        del tf.TOOL_REGISTRY["test_agent_prompt_probe"]
+        tf.clear_tool_caches()
+
+
 def test_no_mobile_routes_registered():
     paths = {route.path for route in app_main.app.routes}
 
@@ -105,6 +195,15 @@ def test_no_mobile_routes_registered():
     assert not any(path.startswith("/ws/mobile") for path in paths)
 
 
+@pytest.fixture
+def fresh_price_cache():
+    """Isolate tests that patch LiteLLM from memoised token prices."""
+
+    pricing.get_token_prices.cache_clear()
+    yield
+    pricing.get_token_prices.cache_clear()
+
+
 def test_live_pricing_fetch():
     """get_token_prices returns numeric costs (may be zero if provider lacks data)."""
 
@@ -128,6 +227,7 @@ def test_cost_math():
     assert abs(calc - expected) < 1e-9
 
 
+@pytest.mark.usefixtures("fresh_price_cache")
 def test_zero_cost_models_do_not_trigger_fallback(monkeypatch):
     """Models legitimately reporting 0 cost should not pick fallback prices."""
 
@@ -145,6 +245,7 @@ def test_zero_cost_models_do_not_trigger_fallback(monkeypatch):
     assert out_c == 0.0
 
 
+@pytest.mark.usefixtures("fresh_price_cache")
 def test_incomplete_pricing_response_logs_and_defaults(monkeypatch):
     """Partial LiteLLM responses log errors but fall back to zeroed fields."""
 
@@ -174,6 +275,24 @@ def test_incomplete_pricing_response_logs_and_defaults(monkeypatch):
     assert any("missing output_cost_per_token" in record.getMessage() for record in records)
 
 
+@pytest.mark.usefixtures("fresh_price_cache")
+def test_token_prices_cached_per_model(monkeypatch):
+    """Repeat lookups for the same model reuse the first LiteLLM result."""
+
+    calls = []
+
+    def counting_cost(*_args, **kwargs):
+        calls.append(kwargs["model"])
+        return 0.001, 0.002
+
+    monkeypatch.setattr(pricing.litellm, "cost_per_token", counting_cost)
+
+    assert pricing.get_token_prices("gpt-3.5-turbo") == (0.001, 0.002)
+    assert pricing.calculate_llm_cost("gpt-3.5-turbo", 10, 10) == pytest.approx(0.03)
+
+    assert calls == ["gpt-3.5-turbo"]
+
+
 def test_missing_api_keys_raise(monkeypatch):
     """get_env should fail noisily if required API keys are absent."""
 
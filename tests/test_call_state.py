@@ -0,0 +1,67 @@
+"""Tests for the staged call registry."""
+
+from app import call_state
+
+SESSION = ("unknown-caller", {"bot_name": "Test"}, None, False, "+15550001")
+TTL = 300.0
+
+
+def test_pop_returns_staged_session_once():
+    registry = call_state._CallRegistry()
+
+    registry.store("CA1", SESSION)
+
+    assert registry.pop("CA1") == SESSION
+    assert registry.pop("CA1") is None
+
+
+def test_staged_sessions_do_not_expire_by_default(monkeypatch):
+    registry = call_state._CallRegistry()
+    clock = [1000.0]
+    monkeypatch.setattr(call_state.time, "monotonic", lambda: clock[0])
+
+    registry.store("CA-late", SESSION)
+    clock[0] += 24 * 60 * 60
+    registry.store("CA-next", SESSION)
+
+    assert registry.pop("CA-late") == SESSION
+    assert registry._expiry_heap == []
+
+
+def test_expired_sessions_are_pruned(monkeypatch):
+    registry = call_state._CallRegistry(staged_ttl_sec=TTL)
+    clock = [1000.0]
+    monkeypatch.setattr(call_state.time, "monotonic", lambda: clock[0])
+
+    registry.store("CA-old", SESSION)
+    clock[0] += TTL + 1
+    registry.store("CA-new", SESSION)
+
+    assert "CA-old" not in registry._call_agent_map
+    assert registry.pop("CA-old") is None
+    assert registry.pop("CA-new") == SESSION
+
+
+def test_restaged_call_keeps_latest_deadline(monkeypatch):
+    registry = call_state._CallRegistry(staged_ttl_sec=TTL)
+    clock = [1000.0]
+    monkeypatch.setattr(call_state.time, "monotonic", lambda: clock[0])
+
+    registry.store("CA1", SESSION)
+    clock[0] += TTL - 1
+    registry.store("CA1", SESSION)
+    clock[0] += 2
+
+    assert registry.pop("CA1") == SESSION
+
+
+def test_pop_rejects_expired_session_without_prune(monkeypatch):
+    registry = call_state._CallRegistry(staged_ttl_sec=TTL)
+    clock = [1000.0]
+    monkeypatch.setattr(call_state.time, "monotonic", lambda: clock[0])
+
+    registry.store("CA1", SESSION)
+    clock[0] += TTL
+
+    assert registry.pop("CA1") is None
+    assert "CA1" not in registry._call_agent_map
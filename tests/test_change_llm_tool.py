@@ -170,3 +170,27 @@ class TestChangeLLMTool:
             result = execute_tool("change_llm", {"model_choice": model})
             assert result["action"] == "model_changed", f"Model {model} should work"
             assert result["model_label"], f"Model {model} should have a label"
+
+    def test_results_do_not_share_mutable_state(self):
+        """Each call gets its own result and settings dicts."""
+        first = execute_tool("change_llm", {"model_choice": "gpt-5"})
+        first["settings"]["temperature"] = 0.0
+        first["previous_model"] = "mutated"
+
+        second = execute_tool("change_llm", {"model_choice": "gpt-5"})
+        assert second["settings"]["temperature"] == 1.0
+        assert second["previous_model"] != "mutated"
+
+    def test_precomputed_spellings_match_slow_normalisation(self):
+        """Every precomputed spelling resolves as the cleaning path would."""
+        from app.tools import change_llm as mod
+
+        for variant, choice in mod._CANONICAL_MAP.items():
+            cleaned = "-".join(
+                part
+                for part in variant.lower().replace("_", "-").replace(" ", "-").split("-")
+                if part
+            )
+            assert mod._ALIAS_MAP[cleaned] == choice
+        assert mod._normalise_model_choice("Gemini Pro") == "gemini-pro"
+        assert mod._normalise_model_choice("  gpt__5   HIGH ") == "gpt-5-high"
@@ -1,9 +1,11 @@
+import copy
 from pathlib import Path
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
-from app.config_schema import ConfigModel, resolve_config_path
+from app.config_schema import AgentConfig, ConfigModel, resolve_config_path
 
 
 def _write_example(root: Path) -> None:
@@ -88,3 +90,47 @@ def test_config_model_accepts_mobile_device_keys_as_extras():
 
     assert extras["mobile_devices"]["device-1"]["agent"] == "unknown-caller"
     assert extras["mobileDevices"]["device-2"]["agent"] == "unknown-caller"
+
+
+def test_agent_config_rejects_duplicate_phone_numbers():
+    with pytest.raises(ValidationError, match="must be unique per agent"):
+        AgentConfig(bot_name="Dup", phone_numbers=["+15550001", "+15550001"])
+
+
+def test_agent_config_rejects_non_string_tools():
+    with pytest.raises(TypeError, match="tools entries must be strings"):
+        AgentConfig.model_validate({"bot_name": "Bad", "tools": ["Ok", 3]})
+
+
+def test_config_model_supports_deep_copy():
+    repo_config = resolve_config_path(
+        None,
+        allow_example_fallback=True,
+        project_root=Path("."),
+    )
+    data = yaml.safe_load(repo_config.read_text(encoding="utf-8"))
+    cfg = ConfigModel.model_validate(data)
+
+    for clone in (copy.deepcopy(cfg), cfg.model_copy(deep=True)):
+        assert clone == cfg
+        clone.defaults.tts_prosody["rate"] = "slow"
+        clone.defaults.tool_runner.status_messages["probe"] = "working"
+        clone.agents["unknown-caller"].tool_prompts["probe"] = "prompt"
+
+    assert "probe" not in cfg.defaults.tool_runner.status_messages
+    assert "probe" not in cfg.agents["unknown-caller"].tool_prompts
+    assert cfg.defaults.tts_prosody.get("rate") != "slow"
+
+
+def test_config_model_rejects_phone_number_shared_across_agents():
+    repo_config = resolve_config_path(
+        None,
+        allow_example_fallback=True,
+        project_root=Path("."),
+    )
+    data = yaml.safe_load(repo_config.read_text(encoding="utf-8"))
+    data["agents"]["unknown-caller"]["phone_numbers"] = ["+15550001"]
+    data["agents"]["second-agent"] = {"bot_name": "Second", "phone_numbers": ["+15550001"]}
+
+    with pytest.raises(ValidationError, match="Duplicate phone number"):
+        ConfigModel.model_validate(data)
@@ -9,6 +9,7 @@ These tests verify that different agents use the correct recipient greenlist
 import pytest
 
 from app import settings
+from app import tool_framework as tf
 from app.tools import email
 
 # ---------------------------------------------------------------------------
@@ -29,9 +30,9 @@ def _validate(addr: str) -> None:
 @pytest.fixture(autouse=True)
 def _reset_agent_context():
     """Reset thread-local agent context before & after each test."""
-    email.set_agent_context(None)
+    tf.set_agent_context(None)
     yield
-    email.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +43,7 @@ def _reset_agent_context():
 def test_greenlist_for_ringdown_demo():
     """ringdown-demo agent should respect its configured recipients."""
     agent_cfg = settings.get_agent_config("ringdown-demo")
-    email.set_agent_context(agent_cfg)
+    tf.set_agent_context(agent_cfg)
 
     # Allowed addresses (present in the agent greenlist)
     allowed = [
@@ -68,7 +69,7 @@ def test_greenlist_for_ringdown_demo():
 def test_greenlist_fallback_for_unknown_caller():
     """unknown-caller agent uses the default greenlist."""
     agent_cfg = settings.get_agent_config("unknown-caller")
-    email.set_agent_context(agent_cfg)
+    tf.set_agent_context(agent_cfg)
 
     allowed = [
         "team@example.com",
@@ -23,7 +23,7 @@ def test_email_registration():
 
 def test_recipient_validation_default():
     """Default greenlist should allow example.com addresses only."""
-    email.set_agent_context(None)
+    tf.set_agent_context(None)
 
     valid = [
         "team@example.com",
@@ -52,7 +52,7 @@ def test_recipient_validation_with_agent_context():
             "^[^@]+@ops\\.example\\.com$",
         ],
     }
-    email.set_agent_context(agent_cfg)
+    tf.set_agent_context(agent_cfg)
 
     email.EmailArgs(to="ops@example.com", subject="test", body="body")
     email.EmailArgs(to="lead@ops.example.com", subject="test", body="body")
@@ -60,12 +60,12 @@ def test_recipient_validation_with_agent_context():
     with pytest.raises(ValueError):
         email.EmailArgs(to="team@example.com", subject="test", body="body")
 
-    email.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_disabled_response_without_credentials():
     """If Gmail credentials are absent the tool should respond with disabled=True."""
-    email.set_agent_context(None)
+    tf.set_agent_context(None)
     result = tf.execute_tool(
         "SendEmail",
         {"to": "team@example.com", "subject": "Hello", "body": "Test"},
@@ -72,6 +72,150 @@ def test_log_turn_bootstraps_schema(tmp_path, monkeypatch):
         assert row.text == "bootstrap check"
 
 
+@pytest.mark.asyncio
+async def test_queue_turn_batches_through_flusher(monkeypatch):
+    """Queued turns should be committed by the flusher, including on shutdown."""
+
+    import asyncio
+
+    from sqlmodel import Session, SQLModel, create_engine, select
+    from sqlmodel.pool import StaticPool
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    monkeypatch.setattr(memory, "engine", engine)
+    monkeypatch.setattr(memory, "Session", Session)
+
+    flusher = asyncio.create_task(memory.run_turn_flusher())
+    await asyncio.sleep(0)
+
+    await memory.queue_turn("user", "first")
+    await memory.queue_turn("bot", "second", source="android-realtime")
+
+    flusher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flusher
+
+    assert memory._turn_queue is None
+    with Session(engine) as sess:
+        rows = sess.exec(select(memory.Turn).order_by(memory.Turn.id)).all()
+    assert [(row.who, row.text, row.source) for row in rows] == [
+        ("user", "first", None),
+        ("bot", "second", "android-realtime"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flusher_writes_pending_turns_on_executor_at_shutdown(monkeypatch):
+    """Turns still queued at cancellation are flushed off the event-loop thread."""
+
+    import asyncio
+    import threading
+
+    from sqlmodel import Session, SQLModel, create_engine, select
+    from sqlmodel.pool import StaticPool
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(memory, "engine", engine)
+
+    writer_threads: list[str] = []
+    original_log_turns = memory.log_turns
+
+    def _recording_log_turns(rows):
+        writer_threads.append(threading.current_thread().name)
+        original_log_turns(rows)
+
+    monkeypatch.setattr(memory, "log_turns", _recording_log_turns)
+
+    flusher = asyncio.create_task(memory.run_turn_flusher())
+    await asyncio.sleep(0)
+
+    # Queue turns and cancel without yielding, so they are still pending when
+    # the flusher shuts down.
+    for i in range(3):
+        memory._turn_queue.put_nowait(memory._turn_row("user", f"turn {i}", None))
+    flusher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flusher
+
+    with Session(engine) as sess:
+        rows = sess.exec(select(memory.Turn).order_by(memory.Turn.id)).all()
+    assert [row.text for row in rows] == ["turn 0", "turn 1", "turn 2"]
+    assert writer_threads
+    assert all(name.startswith("memdb") for name in writer_threads)
+
+
+@pytest.mark.asyncio
+async def test_flusher_keeps_in_flight_batch_when_cancelled(monkeypatch):
+    """A batch waiting on a busy executor is still written exactly once."""
+
+    import asyncio
+    import threading
+
+    from sqlmodel import Session, SQLModel, create_engine, select
+    from sqlmodel.pool import StaticPool
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(memory, "engine", engine)
+
+    # Occupy the single database worker so the flusher's write stays queued.
+    release = threading.Event()
+    blocker = asyncio.get_running_loop().run_in_executor(memory._DB_EXECUTOR, release.wait)
+
+    flusher = asyncio.create_task(memory.run_turn_flusher())
+    await asyncio.sleep(0)
+    await memory.queue_turn("user", "in flight")
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    flusher.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await flusher
+    await blocker
+
+    with Session(engine) as sess:
+        rows = sess.exec(select(memory.Turn)).all()
+    assert [row.text for row in rows] == ["in flight"]
+
+
+def test_agent_state_round_trip(monkeypatch):
+    """save_state should upsert, load_state read back, delete_state remove."""
+
+    from sqlmodel import SQLModel, create_engine
+
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(memory, "engine", engine)
+
+    settings = {"model": "gpt-test", "temperature": 0.5, "max_tokens": 10, "voice": "x"}
+    memory.save_state("agent", settings, [{"role": "user", "content": "hi"}])
+    memory.save_state("agent", settings, [{"role": "user", "content": "héllo"}])
+
+    saved_settings, saved_messages = memory.load_state("agent")
+    assert saved_settings == {"model": "gpt-test", "temperature": 0.5, "max_tokens": 10}
+    assert saved_messages == [{"role": "user", "content": "héllo"}]
+
+    memory.delete_state("agent")
+    assert memory.load_state("agent") == (None, None)
+
+
 def test_execute_tool_invalid_args_raises():
     """execute_tool must raise ValidationError when args fail validation."""
 
@@ -8,7 +8,7 @@ from app import tool_framework as tf
 # Helpers
 # ---------------------------------------------------------------------------
 from app.tool_framework import get_async_result  # after TF import for type clarity
-from app.tools import google_calendar
+from app.tools import google_calendar  # noqa: F401 – ensures registration
 
 
 def _mock_service():
@@ -107,7 +107,7 @@ def test_create_event_normal(mock_get_service):
     mock_get_service.return_value = _mock_service()
 
     # set agent context with bot name
-    google_calendar.set_agent_context({"bot_name": "Ringdown"})
+    tf.set_agent_context({"bot_name": "Ringdown"})
 
     start = datetime.datetime(2025, 1, 1, 15, 0, 0, tzinfo=datetime.UTC).isoformat()
 
@@ -132,13 +132,13 @@ def test_create_event_normal(mock_get_service):
     body_used = service.events.return_value.insert.call_args.kwargs["body"]
     assert body_used["summary"].endswith(" [Ringdown]")
 
-    google_calendar.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 @patch("app.tools.google_calendar._get_calendar_service")
 def test_search_created_by_bot(mock_get_service):
     mock_get_service.return_value = _mock_service()
-    google_calendar.set_agent_context({"bot_name": "Ringdown"})
+    tf.set_agent_context({"bot_name": "Ringdown"})
 
     result = tf.execute_tool(
         "SearchCalendarEvents",
@@ -151,7 +151,7 @@ def test_search_created_by_bot(mock_get_service):
     assert len(result["results"]) == 1  # only Ringdown-tagged event
     assert result["results"][0]["id"] == "evt_123"
 
-    google_calendar.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 @patch("app.tools.google_calendar._get_calendar_service")
@@ -160,7 +160,7 @@ def test_update_event_not_bot(mock_get_service):
     # make the get call return non-bot event
     svc.events.return_value.get.return_value.execute.return_value["summary"] = "External Meeting"
     mock_get_service.return_value = svc
-    google_calendar.set_agent_context({"bot_name": "Ringdown"})
+    tf.set_agent_context({"bot_name": "Ringdown"})
 
     pending = tf.execute_tool(
         "UpdateCalendarEvent",
@@ -173,13 +173,13 @@ def test_update_event_not_bot(mock_get_service):
     res = _wait_for_async(pending["async_id"])
     assert res["success"] is False
     assert "did not create" in res["error"].lower()
-    google_calendar.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 @patch("app.tools.google_calendar._get_calendar_service")
 def test_delete_event_bot(mock_get_service):
     mock_get_service.return_value = _mock_service()
-    google_calendar.set_agent_context({"bot_name": "Ringdown"})
+    tf.set_agent_context({"bot_name": "Ringdown"})
 
     pending = tf.execute_tool(
         "DeleteCalendarEvent",
@@ -195,4 +195,4 @@ def test_delete_event_bot(mock_get_service):
     # ensure delete called
     service = mock_get_service.return_value
     service.events.return_value.delete.assert_called()
-    google_calendar.set_agent_context(None)
+    tf.set_agent_context(None)
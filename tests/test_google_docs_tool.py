@@ -21,7 +21,7 @@ def test_docs_tools_registered():
 def test_folder_validation_default():
     """_is_folder_allowed should reflect default greenlist based on bot_name."""
     # Set agent context with bot_name
-    google_docs.set_agent_context({"bot_name": "testbot"})
+    tf.set_agent_context({"bot_name": "testbot"})
 
     # Allowed folder should return True
     assert google_docs._is_folder_allowed("testbot-default") is True
@@ -30,10 +30,10 @@ def test_folder_validation_default():
     assert google_docs._is_folder_allowed("Random Folder") is False
 
     # Clear agent context after test
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
     # Set agent context with bot_name
-    google_docs.set_agent_context({"bot_name": "testbot"})
+    tf.set_agent_context({"bot_name": "testbot"})
 
     # Valid folders (default greenlist based on bot_name)
     valid_folders = [
@@ -55,7 +55,7 @@ def test_folder_validation_default():
         assert google_docs._is_folder_allowed(folder) is False
 
     # Clear agent context after test
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_folder_validation_dynamic_bot_name():
@@ -67,32 +67,32 @@ def test_folder_validation_dynamic_bot_name():
     ]
 
     for bot_name, expected_folder in test_cases:
-        google_docs.set_agent_context({"bot_name": bot_name})
+        tf.set_agent_context({"bot_name": bot_name})
         assert google_docs._is_folder_allowed(expected_folder) is True
         # Folders for other bots should be disallowed
         for other_bot, other_folder in test_cases:
             if other_bot != bot_name:
                 assert google_docs._is_folder_allowed(other_folder) is False
 
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_folder_validation_missing_agent_context():
     """_is_folder_allowed should error when agent context is missing."""
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
     with pytest.raises(ValueError, match="Agent context is required"):
         google_docs._is_folder_allowed("test-folder")
 
 
 def test_folder_validation_missing_bot_name():
     """_is_folder_allowed should error when bot_name missing in context."""
-    google_docs.set_agent_context({"some_other_field": "value"})
+    tf.set_agent_context({"some_other_field": "value"})
     with pytest.raises(ValueError, match="bot_name"):
         google_docs._is_folder_allowed("test-folder")
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
     # Clear agent context after test
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_folder_validation_with_agent_context():
@@ -104,12 +104,12 @@ def test_folder_validation_with_agent_context():
             "marketing-docs-.*",
         ]
     }
-    google_docs.set_agent_context(test_agent_config)
+    tf.set_agent_context(test_agent_config)
     assert google_docs._is_folder_allowed("Test Folder") is True
     assert google_docs._is_folder_allowed("Project Alpha") is True
     assert google_docs._is_folder_allowed("marketing-docs-q4") is True
     assert google_docs._is_folder_allowed("ringdown-default") is False
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_extract_doc_id():
@@ -136,7 +136,6 @@ def test_create_document_mock():
     """Test document creation with mocked Google API - now async execution."""
     # Set agent context for dynamic folder name
     context = {"bot_name": "testbot"}
-    google_docs.set_agent_context(context)
     tf.set_agent_context(context)
 
     # Mock the services
@@ -205,7 +204,6 @@ def test_create_document_mock():
         mocked_email.assert_called_once()
 
     # Clear agent context after test
-    google_docs.set_agent_context(None)
     tf.set_agent_context(None)
 
 
@@ -386,7 +384,7 @@ def test_read_document_formatting_window_clips_runs():
 def test_update_document_mock():
     """Test document updating with mocked Google API - now async execution."""
     # Set agent context
-    google_docs.set_agent_context({"bot_name": "testbot"})
+    tf.set_agent_context({"bot_name": "testbot"})
 
     mock_docs_service = MagicMock()
     mock_drive_service = MagicMock()
@@ -423,13 +421,13 @@ def test_update_document_mock():
         assert "started asynchronously" in result["message"]
 
     # Clear agent context after test
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_update_document_not_in_default_folder():
     """Test async execution for AppendGoogleDoc - folder validation will happen in background."""
     # Set agent context
-    google_docs.set_agent_context({"bot_name": "testbot"})
+    tf.set_agent_context({"bot_name": "testbot"})
 
     result = tf.execute_tool(
         "AppendGoogleDoc",
@@ -443,7 +441,7 @@ def test_update_document_not_in_default_folder():
     assert "started asynchronously" in result["message"]
 
     # Clear agent context after test
-    google_docs.set_agent_context(None)
+    tf.set_agent_context(None)
 
 
 def test_search_drive_default_filters():
@@ -605,10 +603,13 @@ def test_search_drive_runtime_limit_truncates():
         "nextPageToken": "token123",
     }
 
-    with patch(
-        "app.tools.google_docs._get_services",
-        return_value=(mock_docs_service, mock_drive_service),
-    ), patch("app.tools.google_docs.time.monotonic", side_effect=[0.0, 31.0, 31.0]):
+    with (
+        patch(
+            "app.tools.google_docs._get_services",
+            return_value=(mock_docs_service, mock_drive_service),
+        ),
+        patch("app.tools.google_docs.time.monotonic", side_effect=[0.0, 31.0, 31.0]),
+    ):
         result = tf.execute_tool("SearchGoogleDrive", {"query": "Doc"})
 
     assert result["success"] is True
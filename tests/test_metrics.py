@@ -0,0 +1,51 @@
+"""Tests for the health and metrics endpoints."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import metrics
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(metrics.router)
+    return TestClient(app)
+
+
+def test_healthz_returns_ok_for_both_paths() -> None:
+    client = _client()
+
+    for path in ("/healthz", "/healthz/"):
+        response = client.get(path, follow_redirects=False)
+        assert response.status_code == 200
+        assert response.text == "ok"
+        assert response.headers["content-type"].startswith("text/plain")
+
+
+def test_healthz_builds_a_response_per_request() -> None:
+    first = metrics.healthz()
+    second = metrics.healthz_trailing_slash()
+
+    assert first is not second
+    assert first.body == second.body == b"ok"
+
+
+def test_metrics_payload_cached_within_ttl(monkeypatch) -> None:
+    calls = []
+    clock = [100.0]
+
+    def fake_generate_latest() -> bytes:
+        calls.append(clock[0])
+        return f"sample {len(calls)}\n".encode()
+
+    monkeypatch.setattr(metrics, "generate_latest", fake_generate_latest)
+    monkeypatch.setattr(metrics.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(metrics, "_metrics_cache", None)
+    client = _client()
+
+    assert client.get("/metrics").text == "sample 1\n"
+    clock[0] += metrics._METRICS_CACHE_TTL_SEC / 2
+    assert client.get("/metrics").text == "sample 1\n"
+    clock[0] += metrics._METRICS_CACHE_TTL_SEC
+    assert client.get("/metrics").text == "sample 2\n"
+    assert len(calls) == 2
@@ -15,7 +15,7 @@ def test_search_posts_expected_payload() -> None:
 
     with (
         patch("app.settings.get_env", return_value=SimpleNamespace(tavily_api_key="test-key")),
-        patch("app.tools.tavily.requests.post", return_value=response) as mock_post,
+        patch("app.tools.tavily._CLIENT.post", return_value=response) as mock_post,
     ):
         result = tf.execute_tool("TavilySearch", {"query": "OpenAI", "max_results": 1})
 
@@ -45,7 +45,7 @@ def test_extract_posts_expected_payload() -> None:
 
     with (
         patch("app.settings.get_env", return_value=SimpleNamespace(tavily_api_key="test-key")),
-        patch("app.tools.tavily.requests.post", return_value=response) as mock_post,
+        patch("app.tools.tavily._CLIENT.post", return_value=response) as mock_post,
     ):
         result = tf.execute_tool("TavilyExtract", {"urls": "https://docs.python.org"})
 
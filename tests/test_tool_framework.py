@@ -3,11 +3,15 @@
 
 from __future__ import annotations
 
+import collections
+import contextvars
+import dataclasses
 import json
+import time
 from typing import Any
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, field_validator
 
 from app import settings
 from app import tool_framework as tf
@@ -50,6 +54,17 @@ def test_schema_generation():
     assert "x" in params["properties"]
 
 
+def test_schema_built_once_per_tool():
+    spec = tf.TOOL_REGISTRY["dummy_add"]
+    assert spec.openai_schema() is spec.openai_schema()
+    assert tf.get_tool_schema("dummy_add") is spec.openai_schema()
+    hits = tf.get_tool_schema.cache_info().hits
+    tf.get_tool_schema("dummy_add")
+    assert tf.get_tool_schema.cache_info().hits == hits + 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.async_execution = True  # type: ignore[misc]
+
+
 def test_execute_tool_success():
     res = tf.execute_tool("dummy_add", {"x": 2, "y": 3})
     assert res == 5
@@ -60,6 +75,80 @@ def test_execute_tool_validation_error():
         tf.execute_tool("dummy_add", {"x": "not-int"})
 
 
+def test_agent_context_follows_async_tool_execution():
+    """Async tools see the caller's agent context; other contexts stay isolated."""
+
+    class _ContextArgs(BaseModel):
+        pass
+
+    tf.register_tool(
+        name="test_context_probe",
+        description="Context probe",
+        param_model=_ContextArgs,
+        async_execution=True,
+    )(lambda _args: {"bot_name": (tf.get_agent_context() or {}).get("bot_name")})
+
+    def _run_probe() -> dict[str, Any]:
+        tf.set_agent_context({"bot_name": "probe-bot"})
+        ack = tf.execute_tool("test_context_probe", {})
+        for _ in range(100):
+            result = tf.get_async_result(ack["async_id"])
+            if result is not None:
+                return result
+            time.sleep(0.01)
+        raise AssertionError("async probe did not complete")
+
+    outer = tf.get_agent_context()
+    try:
+        assert contextvars.copy_context().run(_run_probe) == {"bot_name": "probe-bot"}
+        assert tf.get_agent_context() is outer
+    finally:
+        del tf.TOOL_REGISTRY["test_context_probe"]
+        tf.clear_tool_caches()
+
+
+def test_async_tool_args_validated_once():
+    """The async path hands the pre-validated args object to the worker."""
+
+    validations: list[int] = []
+
+    class _CountedArgs(BaseModel):
+        n: int
+
+        @field_validator("n")
+        @classmethod
+        def _count(cls, value: int) -> int:
+            validations.append(value)
+            return value
+
+    tf.register_tool(
+        name="test_validate_once",
+        description="Validation probe",
+        param_model=_CountedArgs,
+        async_execution=True,
+    )(lambda args: {"n": args.n})
+
+    try:
+        ack = tf.execute_tool("test_validate_once", {"n": 7})
+        for _ in range(100):
+            if tf.get_async_result(ack["async_id"]) is not None:
+                break
+            time.sleep(0.01)
+        assert tf.get_async_result(ack["async_id"]) == {"n": 7}
+        assert validations == [7]
+    finally:
+        del tf.TOOL_REGISTRY["test_validate_once"]
+        tf.clear_tool_caches()
+
+
+def test_call_context_setters_resolved_once():
+    """Opted-in tool modules are resolved once per registry state."""
+
+    setters = tf._call_context_setters()
+    assert tf._call_context_setters() is setters
+    assert "app.tools.hang_up" in dict(setters)
+
+
 def test_get_tools_for_agent():
     agent_cfg = {"tools": ["dummy_add"]}
     tools = tf.get_tools_for_agent(agent_cfg)
@@ -67,6 +156,17 @@ def test_get_tools_for_agent():
     assert tools[0]["function"]["name"] == "dummy_add"
 
 
+def test_get_tools_for_agent_reuses_resolved_schemas():
+    first = tf.get_tools_for_agent({"tools": ["dummy_add"]})
+    second = tf.get_tools_for_agent({"tools": ["dummy_add"]})
+    assert first == second
+    assert first is not second  # callers get their own list
+    assert first[0] is second[0]
+
+    with pytest.raises(KeyError, match="not registered"):
+        tf.get_tools_for_agent({"tools": ["dummy_add", "no_such_tool"]})
+
+
 def test_list_tools():
     names = tf.list_tools()
     assert "dummy_add" in names
@@ -105,6 +205,29 @@ def test_programmatic_tool_prompts():
     assert "send_email" in prompts["SendEmail"]
 
 
+def test_programmatic_tool_prompts_cached_until_registration():
+    """The prompt map is reused between calls and rebuilt when a tool registers."""
+
+    first = settings.get_programmatic_tool_prompts()
+    assert settings.get_programmatic_tool_prompts() is first
+    with pytest.raises(TypeError):
+        first["dummy_add"] = "changed"  # type: ignore[index]
+
+    class _PromptArgs(BaseModel):
+        pass
+
+    tf.register_tool(
+        name="test_prompt_cache", description="Cache probe", param_model=_PromptArgs, prompt="probe"
+    )(lambda _args: None)
+    try:
+        refreshed = settings.get_programmatic_tool_prompts()
+        assert refreshed is not first
+        assert refreshed["test_prompt_cache"] == "probe"
+    finally:
+        del tf.TOOL_REGISTRY["test_prompt_cache"]
+        tf.clear_tool_caches()
+
+
 def test_build_tool_prompts_for_agent():
     """Test that tool prompts are correctly built for specific agent configurations."""
 
@@ -130,6 +253,10 @@ def test_build_tool_prompts_for_agent():
     assert "Test Header" in empty_prompts
     assert "## tavily_search" not in empty_prompts
 
+    # Repeat builds for the same tools and header are served from the cache
+    again = settings.build_tool_prompts_for_agent(["TavilySearch", "SendEmail"], tool_header)
+    assert again is multi_tool_prompts
+
 
 def test_agent_tool_prompts_interpolation():
     """Test that {ToolPrompts} placeholder works correctly for different agents."""
@@ -194,6 +321,10 @@ def test_tool_response_truncation():
     truncated = tf._truncate_tool_response(small_result)
     assert truncated == small_result
 
+    # Scalars, empty containers and short strings are returned untouched
+    for value in (None, True, 42, 3.5, "", "short", {}, []):
+        assert tf._truncate_tool_response(value) is value
+
     # Test large string - should be truncated
     large_string = "x" * 250000
     truncated = tf._truncate_tool_response(large_string)
@@ -233,12 +364,72 @@ def test_tool_response_truncation():
     truncated_json = json.dumps(truncated)
     assert len(truncated_json) <= 200000
 
+    # Non-ASCII text is measured in characters, not UTF-8 bytes
+    cjk = "漢" * 150_000  # 150k characters, 450k bytes
+    assert tf._truncate_tool_response(cjk) is cjk
+    assert tf._truncate_tool_response({"text": cjk}) == {"text": cjk}
+    truncated = tf._truncate_tool_response("漢" * 250_000)
+    assert "50002 more characters removed" in truncated
+    assert len(json.dumps(truncated, ensure_ascii=False)) <= 200000
+
+    # Container subclasses take the same path as their base type
+    ordered = collections.OrderedDict(huge_dict)
+    truncated = tf._truncate_tool_response(ordered)
+    assert "_truncation_notice" in truncated
+    assert len(json.dumps(truncated)) <= 200000
+
+
+def test_trunc_defers_preview_until_formatted(monkeypatch):
+    calls = []
+    real_preview = tf._json_preview
+
+    def _recording_preview(obj, limit=500):
+        calls.append(limit)
+        return real_preview(obj, limit)
+
+    monkeypatch.setattr(tf, "_json_preview", _recording_preview)
+
+    lazy = tf._Trunc({"data": "x" * 1000}, limit=20)
+    assert calls == []
+    assert str(lazy) == '{"data":"xxxxxxxxxxx'
+    assert calls == [20]
+
+
+def test_json_len_matches_stdlib_dumps():
+    """Nested containers are measured with json.dumps' default separators."""
+
+    nested = {
+        "items": [{"id": i, "tags": ["a", "b"], "score": 0.1 * i} for i in range(50)],
+        "meta": {"total": 50, "empty": {}, "none": None, "flag": True, 7: "int key"},
+        "text": 'quote " and \\ backslash\nnewline \u0001 漢字',
+        "big": 2**70,
+        "floats": [1e16, 1.5e-7, float("inf")],
+        "pairs": [(1, 2), []],
+    }
+
+    for value in (nested, nested["items"], nested["meta"], [nested, [nested]]):
+        assert tf._json_len(value) == len(json.dumps(value, ensure_ascii=False))
+
+    # A response over the budget only through json.dumps' spacing is still cut
+    response = {"rows": [{"k": "v" * 10} for _ in range(10_000)]}
+    compact = len(json.dumps(response, separators=(",", ":")))
+    assert compact <= tf._TOOL_RESPONSE_MAX_CHARS < len(json.dumps(response))
+    assert "_truncation_notice" in tf._truncate_tool_response(response)
+
 
 # ---------------------------------------------------------------------------
 # Cross-Provider Compatibility Tests
 # ---------------------------------------------------------------------------
 
 
+def test_error_email_args_are_capped():
+    assert tf._format_error_args({"x": 1}) == '{\n  "x": 1\n}'
+
+    text = tf._format_error_args({"blob": "a" * 10_000})
+    assert len(text) < tf._ERROR_EMAIL_ARGS_MAX_CHARS + 100
+    assert text.endswith("characters truncated]")
+
+
 def test_json_schema_draft_2020_12_compatibility():
     """Test that schemas use JSON Schema draft 2020-12 format for cross-provider compatibility."""
 
@@ -0,0 +1,42 @@
+"""Tests for app.tool_runner.ToolRunner."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from app.tool_runner import ToolRunner
+
+
+async def _collect(runner: ToolRunner, exec_fn) -> list:
+    return [event async for event in runner.run("probe", "call-1", {}, exec_fn)]
+
+
+@pytest.mark.asyncio
+async def test_slow_tool_emits_thinking_sounds_then_result():
+    runner = ToolRunner(thinking_sounds={"probe": ["hmm"]}, interval_sec=0.2)
+
+    def _slow(_args):
+        time.sleep(0.5)
+        return {"ok": True}
+
+    events = await _collect(runner, _slow)
+
+    assert events[0].kind == "thinking"  # announcement
+    assert [e.text for e in events[1:-1]] == ["hmm"] * (len(events) - 2)
+    assert len(events) >= 3
+    assert events[-1].kind == "result" and events[-1].data == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_tool_error_is_returned_as_result():
+    runner = ToolRunner(thinking_sounds={"probe": None})
+
+    def _boom(_args):
+        raise RuntimeError("boom")
+
+    events = await _collect(runner, _boom)
+
+    assert [e.kind for e in events] == ["thinking", "result"]
+    assert events[-1].data == {"error": "boom"}
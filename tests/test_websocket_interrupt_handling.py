@@ -50,12 +50,7 @@ async def test_interrupt_message_handling():
             patch.object(websocket_api, "get_agent_config") as mock_get_agent,
             patch.object(websocket_api, "pop_call", return_value=None),
             patch.object(websocket_api, "stream_response") as mock_stream,
-            patch.object(websocket_api, "log_turn"),
-            patch.object(
-                websocket_api,
-                "run_in_threadpool",
-                side_effect=lambda f, *args: None,
-            ),
+            patch.object(websocket_api, "queue_turn"),
         ):
             mock_get_agent.return_value = {
                 "prompt": "Test prompt",
@@ -110,12 +105,7 @@ async def test_malformed_json_handling():
             patch.object(websocket_api, "get_agent_config") as mock_get_agent,
             patch.object(websocket_api, "pop_call", return_value=None),
             patch.object(websocket_api, "stream_response") as mock_stream,
-            patch.object(websocket_api, "log_turn"),
-            patch.object(
-                websocket_api,
-                "run_in_threadpool",
-                side_effect=lambda f, *args: None,
-            ),
+            patch.object(websocket_api, "queue_turn"),
         ):
             mock_get_agent.return_value = {
                 "prompt": "Test prompt",
@@ -235,12 +225,7 @@ async def test_interrupt_does_not_break_conversation_flow():
             patch.object(websocket_api, "get_agent_config") as mock_get_agent,
             patch.object(websocket_api, "pop_call", return_value=None),
             patch.object(websocket_api, "stream_response") as mock_stream,
-            patch.object(websocket_api, "log_turn"),
-            patch.object(
-                websocket_api,
-                "run_in_threadpool",
-                side_effect=lambda f, *args: None,
-            ),
+            patch.object(websocket_api, "queue_turn"),
         ):
             mock_get_agent.return_value = {
                 "prompt": "Test prompt",
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
+import orjson
 import websockets
 from twilio.request_validator import RequestValidator
 
@@ -83,11 +84,11 @@ async def _run(config: SmokeConfig) -> int:
             subprotocols=["conversationrelay.v1"],
         ) as ws:
             setup_payload = {"type": "setup", "callSid": config.call_sid}
-            await ws.send(json.dumps(setup_payload))
+            await ws.send(orjson.dumps(setup_payload).decode())
             _json_log("INFO", "Sent setup payload", payload=setup_payload)
 
             prompt_payload = {"type": "prompt", "voicePrompt": config.prompt}
-            await ws.send(json.dumps(prompt_payload))
+            await ws.send(orjson.dumps(prompt_payload).decode())
             _json_log("INFO", "Sent prompt payload", payload=prompt_payload)
 
             for idx in range(config.receive_messages):
@@ -97,8 +98,8 @@ async def _run(config: SmokeConfig) -> int:
                     _json_log("WARNING", "Timed out waiting for WebSocket response", index=idx)
                     break
                 try:
-                    frame = json.loads(raw)
-                except json.JSONDecodeError:
+                    frame = orjson.loads(raw)
+                except orjson.JSONDecodeError:
                     _json_log("WARNING", "Non-JSON frame received", index=idx, raw=raw)
                 else:
                     _json_log("INFO", "Received frame", index=idx, frame=frame)